@@ -0,0 +1,104 @@
+import pygame
+import os
+
+# -------------------------
+# --- SHARED IMAGE CACHE ---
+# -------------------------
+#
+# Every sprite in the game (food, player frames, background, menu pictures)
+# is requested through this module. Each file is decoded from disk only once,
+# and every (file, size) pair is scaled only once, so spawning a new Food or
+# opening a menu screen never touches the disk again.
+
+_sources = {}   # full path -> decoded image at its original size
+_scaled = {}    # (full path, size) -> scaled image ready to blit
+counters = {"surfaces": 0}  # Number of surfaces created so far (read by the profiler)
+
+
+def _prepare(image):
+    """
+    Converts an image to the display's pixel format so blits take the fast path.
+
+    Images with per-pixel transparency (PNG cutouts) use convert_alpha(),
+    opaque ones (the JPG background) use convert(). If no display mode has
+    been set yet, the image is returned unchanged.
+    """
+    if pygame.display.get_surface() is None:
+        return image
+    if image.get_flags() & pygame.SRCALPHA:
+        return image.convert_alpha()
+    return image.convert()
+
+
+def _source(path):
+    """Decodes a file from disk the first time it is asked for."""
+    image = _sources.get(path)
+    if image is None:
+        image = pygame.image.load(path)
+        _sources[path] = image
+        counters["surfaces"] += 1
+    return image
+
+
+def get_image(assets_path, filename, size=None):
+    """
+    Returns a cached image, decoding and scaling it only on the first request.
+
+    Parameters:
+    - assets_path: folder that holds the image file
+    - filename: name of the image file inside the folder
+    - size: (width, height) to scale to, or None to keep the original size
+    """
+    path = os.path.join(assets_path, filename)
+    key = (path, tuple(size) if size is not None else None)
+    image = _scaled.get(key)
+    if image is None:
+        image = _source(path)
+        if size is not None:
+            image = pygame.transform.scale(image, key[1])
+        image = _prepare(image)
+        _scaled[key] = image
+        counters["surfaces"] += 1
+    return image
+
+
+def is_cached(assets_path, filename, size=None):
+    """True if get_image() would return without touching the disk."""
+    return (os.path.join(assets_path, filename), tuple(size) if size is not None else None) in _scaled
+
+
+def add_image(assets_path, filename, size, image):
+    """
+    Puts an already scaled image into the cache (used by the sprite bundle).
+
+    The image is converted to the display pixel format like any other.
+    """
+    path = os.path.join(assets_path, filename)
+    _scaled[(path, tuple(size) if size is not None else None)] = _prepare(image)
+    counters["surfaces"] += 1
+
+
+def evict_unused(keep):
+    """
+    Keeps only the (filename, size) pairs listed in `keep` and drops the rest.
+
+    Decoded originals that no kept image was made from are dropped as well.
+    Returns the number of scaled images removed.
+    """
+    keep = {(filename, tuple(size) if size is not None else None) for filename, size in keep}
+    removed = 0
+    for key in list(_scaled):
+        path, key_size = key
+        if (os.path.basename(path), key_size) not in keep:
+            del _scaled[key]
+            removed += 1
+    used_paths = {path for path, _ in _scaled}
+    for path in list(_sources):
+        if path not in used_paths:
+            del _sources[path]
+    return removed
+
+
+def stats():
+    """Returns a small dict with how many images are cached."""
+    return {"decoded": len(_sources), "scaled": len(_scaled)}
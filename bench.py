@@ -0,0 +1,240 @@
+import os
+
+# Run without a window or sound card: must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import pygame
+
+import assets
+import logic
+import profiler
+import render
+import text_cache
+from food import Food, FoodPool
+from player import Player
+
+# -------------------------
+# --- BENCHMARK SUITE ---
+# -------------------------
+#
+# Measures the hot paths of the game under SDL's dummy video driver and
+# prints the results as JSON, so runs on different commits can be compared:
+#
+#   python bench.py --out before.json
+#   python bench.py --compare before.json      (exit code 1 on a regression)
+
+WIDTH, HEIGHT = 800, 600
+ASSETS_PATH = "assets"
+ITEM_COUNTS = [10, 100, 1000]
+REGRESSION_THRESHOLD = 1.25   # A benchmark 25% slower than the baseline counts as a regression
+
+
+def measure(function, number, repeat=5):
+    """
+    Times `function` called `number` times, `repeat` times over.
+
+    Returns a dict with the best and median time per call in microseconds.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        runs.append((time.perf_counter() - start) / number)
+    return {"best_us": round(min(runs) * 1e6, 3),
+            "median_us": round(statistics.median(runs) * 1e6, 3),
+            "calls": number * repeat}
+
+
+def fill_store(game, count, rng):
+    """Spreads `count` items over the playfield so none fall off during the benchmark."""
+    game.foods.clear()
+    for _ in range(count):
+        game.foods.spawn(rng.choice(logic.FOOD_TYPES), rng, 0)
+    y = [rng.uniform(-50, HEIGHT - 60) for _ in range(count)]
+    if isinstance(game.foods, logic.FoodList):
+        for food, food_y in zip(game.foods, y):
+            food.y = food_y
+            food.rect.center = (food.x, food.y)
+    else:
+        game.foods.y[:count] = y
+
+
+def bench_food_construction(results):
+    rng = random.Random(0)
+    results["food_construct"] = measure(lambda: Food("shrimp", ASSETS_PATH, WIDTH, rng), 2000)
+
+    pool = FoodPool(16, ASSETS_PATH, WIDTH)
+    results["food_pool_acquire_release"] = measure(lambda: pool.release(pool.acquire("shrimp", rng)), 20000)
+
+
+def bench_update(results, stores):
+    rng = random.Random(0)
+    for store in stores:
+        for count in ITEM_COUNTS:
+            game = logic.Game(WIDTH, HEIGHT, seed=0, assets_path=ASSETS_PATH, store=store)
+            fill_store(game, count, rng)
+            # Speed 0 keeps the item count constant; collisions with the player still run
+            # against a rect far away so nothing is removed
+            far_away = [pygame.Rect(-10000, -10000, 160, 160)]
+            results[f"update_{store}_{count}"] = measure(
+                lambda: game.foods.update(0, far_away, HEIGHT), max(10, 20000 // count))
+
+
+def bench_render(results, screen, font):
+    rng = random.Random(0)
+    background = assets.get_image(ASSETS_PATH, "background.jpg", (WIDTH, HEIGHT))
+    player = Player(WIDTH // 2, HEIGHT - 80, 160, ASSETS_PATH, WIDTH)
+    hud = text_cache.Hud(font, (255, 255, 255), WIDTH)
+
+    results["background_blit"] = measure(lambda: screen.blit(background, (0, 0)), 500)
+    results["draw_text_cached"] = measure(
+        lambda: text_cache.cache.render("Score: 10", font, (255, 255, 255)), 5000)
+    results["font_render_uncached"] = measure(lambda: font.render("Score: 10", True, (255, 255, 255)), 1000)
+    results["player_update"] = measure(player.update, 20000)
+    results["player_draw"] = measure(lambda: player.draw(screen), 5000)
+
+    for count in ITEM_COUNTS[:2]:
+        game = logic.Game(WIDTH, HEIGHT, seed=0, assets_path=ASSETS_PATH)
+        fill_store(game, count, rng)
+
+        def frame():
+            screen.blit(background, (0, 0))
+            game.foods.draw(screen)
+            player.update()
+            player.draw(screen)
+            hud.update(game.score, game.lives, game.high_score)
+            hud.draw(screen)
+            pygame.display.flip()
+        results[f"full_frame_{count}"] = measure(frame, 200)
+
+
+def bench_window_scaling(results):
+    """Presents the 800x600 frame in 1080p and 4K windows (fractional fit and whole-number scale)."""
+    background = assets.get_image(ASSETS_PATH, "background.jpg", (WIDTH, HEIGHT))
+    # A typical dirty frame: a few items, the axolotl and the HUD
+    rects = [pygame.Rect(x, y, 100, 100) for x, y in ((100, 50), (350, 200), (600, 400))]
+    rects += [pygame.Rect(320, 440, 160, 160), pygame.Rect(10, 10, 120, 60)]
+    for label, size in (("1080p", (1920, 1080)), ("4k", (3840, 2160))):
+        for integer in (False, True):
+            window = render.Window((WIDTH, HEIGHT), size, integer)
+            window.surface.blit(background, (0, 0))
+            name = f"window_{label}_{'integer' if integer else 'fit'}"
+            results[f"{name}_flip"] = measure(window.flip, 50)
+            results[f"{name}_dirty"] = measure(lambda: window.update(rects), 200)
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+def bench_startup(results):
+    """Starts a fresh interpreter and times it until the first frame is shown."""
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, __file__, "--startup-probe"], capture_output=True, text=True,
+                            check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    total = time.perf_counter() - start
+    probe = json.loads(output.strip().splitlines()[-1])
+    results["startup_first_frame"] = {"in_process_ms": probe["first_frame_ms"],
+                                      "assets_ready_ms": probe["assets_ready_ms"],
+                                      "process_ms": round(total * 1000, 3)}
+
+
+def startup_probe():
+    """Runs inside the child process of bench_startup()."""
+    start = time.perf_counter()
+    import main
+    app = main.App(profiler.FrameProfiler())
+    app.run_frame()     # The title screen, with sprites still loading in the background
+    first_frame = time.perf_counter() - start
+    app.loader.wait()
+    app.run_frame()
+    print(json.dumps({"first_frame_ms": round(first_frame * 1000, 3),
+                      "assets_ready_ms": round((time.perf_counter() - start) * 1000, 3)}))
+
+
+def run(stores):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = pygame.font.SysFont(None, 36)
+    results = {}
+    bench_food_construction(results)
+    bench_update(results, stores)
+    bench_render(results, screen, font)
+    bench_window_scaling(results)
+    bench_startup(results)
+    pygame.quit()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline):
+    """Prints the ratio to the baseline for each benchmark. Returns the names that regressed."""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        key = "best_us" if "best_us" in result else "in_process_ms"
+        if not old or key not in old or not old[key]:
+            continue
+        ratio = result[key] / old[key]
+        flag = "  REGRESSION" if ratio > REGRESSION_THRESHOLD else ""
+        print(f"{name:28s} {old[key]:12.3f} -> {result[key]:12.3f}  x{ratio:.2f}{flag}", file=sys.stderr)
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless SnackLotl benchmarks")
+    parser.add_argument("--out", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--startup-probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.startup_probe:
+        startup_probe()
+        return 0
+
+    try:
+        import numpy  # noqa: F401  (the array store is optional)
+        stores = ["list", "array"]
+    except ImportError:
+        stores = ["list"]
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "video_driver": os.environ["SDL_VIDEODRIVER"],
+        "results": run(stores),
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as file:
+            file.write(text)
+    print(text)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        if compare(report["results"], baseline):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
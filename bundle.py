@@ -0,0 +1,149 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+
+import pygame
+
+import assets
+
+# -------------------------
+# --- PRE-BAKED SPRITE BUNDLE ---
+# -------------------------
+#
+# Decoding the JPG/PNG files and scaling them is most of the startup time.
+# `python bundle.py` decodes and scales every sprite once, at build time, and
+# writes the raw pixels into one file:
+#
+#   header   magic "SLBN", version, length of the index JSON
+#   index    JSON list of {file, size, format, offset, length, source mtime/size}
+#   pixels   raw RGB/RGBA buffers at their final sizes, 16-byte aligned
+#
+# At startup load() memory-maps the bundle and makes each surface straight
+# from its buffer, so nothing is decoded or scaled. If the bundle is missing,
+# was built from different source files, or is from an older version, load()
+# returns 0 and the game loads the loose files in assets/ as before.
+
+MAGIC = b"SLBN"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxI")   # magic, version, index length
+ALIGN = 16
+BUNDLE_NAME = "sprites.bundle"
+
+_maps = []  # Open memory maps; surfaces made with frombuffer share their memory
+
+
+def _source_stamp(assets_path, filename):
+    """Modification time and size of a source file, used to detect a stale bundle."""
+    stat = os.stat(os.path.join(assets_path, filename))
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def build(assets_path, images, path=None):
+    """
+    Decodes and scales `images` ((filename, size) pairs) and writes the bundle.
+
+    Returns the path of the written bundle.
+    """
+    path = path or os.path.join(assets_path, BUNDLE_NAME)
+    entries = []
+    buffers = []
+    offset = 0
+    for filename, size in images:
+        image = pygame.image.load(os.path.join(assets_path, filename))
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        pixel_format = "RGBA" if image.get_flags() & pygame.SRCALPHA else "RGB"
+        data = pygame.image.tobytes(image, pixel_format)
+        entries.append({"file": filename, "size": list(image.get_size()), "scaled": size is not None,
+                        "format": pixel_format, "offset": offset, "length": len(data),
+                        "source": _source_stamp(assets_path, filename)})
+        padding = -len(data) % ALIGN
+        buffers.append(data + bytes(padding))
+        offset += len(data) + padding
+
+    index = json.dumps(entries).encode()
+    index += b" " * (-(HEADER.size + len(index)) % ALIGN)  # Pixels start on an aligned offset
+    with open(path + ".tmp", "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        file.write(index)
+        for data in buffers:
+            file.write(data)
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def load(assets_path, path=None):
+    """
+    Fills the shared image cache from the bundle.
+
+    Returns the number of images loaded, or 0 if the bundle is missing, stale
+    or damaged (the game then loads the loose files instead).
+    """
+    path = path or os.path.join(assets_path, BUNDLE_NAME)
+    if not os.path.exists(path):
+        return 0
+    try:
+        with open(path, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as error:   # ValueError: an empty file cannot be mapped
+        print("Ignoring sprite bundle", path, "-", error)
+        return 0
+
+    view = None
+    try:
+        magic, version, index_length = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            data.close()
+            return 0
+        entries = json.loads(data[HEADER.size:HEADER.size + index_length])
+        try:
+            stale = any(_source_stamp(assets_path, entry["file"]) != entry["source"] for entry in entries)
+        except OSError:
+            stale = True
+        if stale:
+            data.close()
+            return 0
+
+        # Make every surface before touching the cache, so a damaged bundle adds nothing
+        pixels_start = HEADER.size + index_length
+        view = memoryview(data)
+        images = []
+        for entry in entries:
+            start = pixels_start + entry["offset"]
+            buffer = view[start:start + entry["length"]]
+            surface = pygame.image.frombuffer(buffer, tuple(entry["size"]), entry["format"])
+            images.append((entry["file"], tuple(entry["size"]) if entry["scaled"] else None, surface))
+    except (ValueError, TypeError, struct.error, json.JSONDecodeError, KeyError) as error:
+        print("Ignoring damaged sprite bundle", path, "-", error)
+        # The surfaces made so far read from the map: drop them so it can be closed
+        images = surface = buffer = None
+        if view is not None:
+            view.release()
+        data.close()
+        return 0
+
+    for filename, size, surface in images:
+        assets.add_image(assets_path, filename, size, surface)
+    _maps.append(data)
+    return len(images)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack every sprite into one pre-scaled bundle file")
+    parser.add_argument("--out", help=f"bundle path (default: assets/{BUNDLE_NAME})")
+    args = parser.parse_args(argv)
+
+    import main as game_main
+    path = build(game_main.ASSETS_PATH, game_main.GAME_IMAGES + game_main.MENU_IMAGES, args.out)
+    print(f"Wrote {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+from bisect import bisect_left
+
+# -------------------------
+# --- BROAD-PHASE COLLISION ---
+# -------------------------
+#
+# Testing every falling item against every catcher costs items x catchers
+# rect checks each tick. Falling items never move sideways, so they can be
+# kept sorted by their left edge for their whole life: each catcher then only
+# looks at the items whose horizontal range can overlap it (found with a
+# binary search) and tests those exactly. The result is always the same set
+# of hits as the all-pairs loop.
+
+
+def brute_force_hits(item_rects, catcher_rects):
+    """Reference all-pairs test: indices of items that overlap any catcher, in item order."""
+    return [i for i, rect in enumerate(item_rects) if rect.collidelist(catcher_rects) != -1]
+
+
+class SweepIndex:
+    """
+    Sort-and-sweep index of item rects on the x axis.
+
+    Items are added when they spawn and removed when they leave play. The rect
+    objects themselves are stored, so their vertical movement is seen without
+    updating the index; only their left edge and width must stay the same.
+    """
+
+    def __init__(self):
+        self.entries = []    # (left, sequence number) pairs kept sorted
+        self.rects = []      # Rect for each entry, in the same order
+        self.lefts = []      # Left edges, in the same order (for binary search)
+        self.max_width = 0
+        self.next_seq = 0
+
+    def __len__(self):
+        return len(self.rects)
+
+    def add(self, rect):
+        """Adds an item rect. Returns the key needed to remove it later."""
+        key = (rect.left, self.next_seq)
+        self.next_seq += 1
+        i = bisect_left(self.entries, key)
+        self.entries.insert(i, key)
+        self.rects.insert(i, rect)
+        self.lefts.insert(i, rect.left)
+        self.max_width = max(self.max_width, rect.width)
+        return key
+
+    def remove(self, key):
+        """Removes the item added under `key`."""
+        i = bisect_left(self.entries, key)
+        del self.entries[i]
+        del self.rects[i]
+        del self.lefts[i]
+
+    def clear(self):
+        self.entries.clear()
+        self.rects.clear()
+        self.lefts.clear()
+        self.max_width = 0
+
+    def query(self, rect):
+        """Returns the item rects that overlap `rect`."""
+        # An item can only overlap if its left edge lies in (rect.left - max_width, rect.right)
+        start = bisect_left(self.lefts, rect.left - self.max_width + 1)
+        end = bisect_left(self.lefts, rect.right, start)
+        candidates = self.rects[start:end]
+        return [candidates[j] for j in rect.collidelistall(candidates)]
+
+
+def find_hits(item_rects, catcher_rects):
+    """
+    Indices of items that overlap any catcher, in item order.
+
+    Same result as brute_force_hits(), using a SweepIndex built for this call.
+    """
+    index = SweepIndex()
+    for rect in item_rects:
+        index.add(rect)
+    hit_ids = {id(hit) for catcher in catcher_rects for hit in index.query(catcher)}
+    return [i for i, rect in enumerate(item_rects) if id(rect) in hit_ids]
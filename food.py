@@ -1,26 +1,41 @@
 import pygame
 import random
-import os
+
+import assets
 
 class Food:
-    SPEED = 5  # Falling speed of food
+    # Fixed attribute slots: smaller objects and no per-instance __dict__
+    __slots__ = ("type", "assets_path", "screen_width", "x", "y", "speed", "image", "rect")
 
-    def __init__(self, food_type, assets_path, screen_width):
-        self.type = food_type  # shrimp, fish, or toxin
-        self.assets_path = assets_path
+    SPEED = 5  # Default falling speed of food
+    SIZE = 100  # Width and height of the food image
 
-        # Random initial horizontal position
-        self.x = random.randint(20, screen_width - 20)
-        self.y = -50  # Start above the visible screen
+    def __init__(self, food_type, assets_path, screen_width, rng=random):
+        self.assets_path = assets_path
+        self.screen_width = screen_width
+        self.speed = self.SPEED
 
-        # Load and scale the correct image based on type
-        self.load_image()
+        # The image is looked up on the first draw, so headless games never load it
+        self.image = None
+        self.type = None
 
         # Create a rect for positioning and collision
-        self.rect = self.image.get_rect(center=(self.x, self.y))
+        self.rect = pygame.Rect(0, 0, self.SIZE, self.SIZE)
+        self.reset(food_type, rng)
+
+    def reset(self, food_type, rng=random):
+        """Puts the food back above the screen as a new item, reusing this object."""
+        if food_type != self.type:
+            self.image = None  # A different type needs a different image
+        self.type = food_type  # shrimp, fish, or toxin
+
+        # Random initial horizontal position
+        self.x = rng.randint(20, self.screen_width - 20)
+        self.y = -50  # Start above the visible screen
+        self.rect.center = (self.x, self.y)
 
     def load_image(self):
-        """Load and scale the image for the given food type."""
+        """Look up the scaled image for the given food type."""
         if self.type == 'shrimp':
             filename = 'food_shrimp.png'
         elif self.type == 'fish':
@@ -30,15 +45,61 @@ class Food:
         else:
             filename = 'food_fish.png'  # default fallback
 
-        # Load and scale image to 100x100
-        self.image = pygame.image.load(os.path.join(self.assets_path, filename))
-        self.image = pygame.transform.scale(self.image, (100, 100))
+        # Fetch the 100x100 image from the shared cache (decoded only once)
+        self.image = assets.get_image(self.assets_path, filename, (self.SIZE, self.SIZE))
 
     def fall(self):
         """Move the food down by its speed."""
-        self.y += self.SPEED
+        self.y += self.speed
         self.rect.center = (self.x, self.y)
 
-    def draw(self, screen):
-        """Draw the food item on the screen."""
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, lag=0):
+        """
+        Draw the food item on the screen. Returns the drawn area.
+
+        Parameters:
+        - lag: pixels above its simulated position to draw it (for smooth movement between ticks)
+        """
+        if self.image is None:
+            self.load_image()
+        return screen.blit(self.image, self.rect.move(0, -lag) if lag else self.rect)
+
+
+class FoodPool:
+    """
+    Reuses Food objects instead of creating a new one for every spawn.
+
+    `capacity` objects are created up front. acquire() hands out a free one and
+    release() takes it back, so a running game allocates no new Food objects.
+    If more than `capacity` items are alive at once the pool creates extra
+    objects and counts them in `overflows`; they are kept for later reuse.
+    """
+
+    def __init__(self, capacity, assets_path, screen_width):
+        self.capacity = capacity
+        self.assets_path = assets_path
+        self.screen_width = screen_width
+        self.free_items = [Food('fish', assets_path, screen_width) for _ in range(capacity)]
+        self.live = 0       # Items handed out and not yet released
+        self.overflows = 0  # Items created because the pool was empty
+
+    @property
+    def free(self):
+        """Number of items ready to be handed out."""
+        return len(self.free_items)
+
+    def acquire(self, food_type, rng=random):
+        """Returns a food item reset to the top of the screen."""
+        if self.free_items:
+            food = self.free_items.pop()
+            food.reset(food_type, rng)
+        else:
+            food = Food(food_type, self.assets_path, self.screen_width, rng)
+            self.overflows += 1
+        self.live += 1
+        return food
+
+    def release(self, food):
+        """Takes an item back so a later spawn can reuse it."""
+        self.live -= 1
+        self.free_items.append(food)
@@ -0,0 +1,142 @@
+import numpy as np
+
+import assets
+from food import Food
+
+# -------------------------
+# --- STRUCTURE-OF-ARRAYS FOOD STORE ---
+# -------------------------
+#
+# Stores every falling item as one slot in a few contiguous NumPy arrays
+# instead of one Food object per item. Falling, culling and the collision
+# test against the player run as a single vectorized pass over all items,
+# and removing an item moves the last slot into its place (swap-and-pop).
+# It behaves exactly like logic.FoodList, so the two can be swapped freely.
+
+
+class FoodArray:
+    def __init__(self, assets_path, screen_width, food_types, capacity=64):
+        self.assets_path = assets_path
+        self.screen_width = screen_width
+        self.food_types = list(food_types)  # type code -> type name
+        self.count = 0                      # Number of live items (slots 0..count-1)
+        self.next_seq = 0                   # Spawn order, used to report hits in list order
+
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.type = np.zeros(capacity, dtype=np.int8)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        """Doubles the capacity of every array."""
+        capacity = len(self.x) * 2
+        for name in ("x", "y", "speed", "type", "seq"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, food_type, rng, speed):
+        """Adds one item above the screen at a random horizontal position. Returns its x."""
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        self.x[i] = rng.randint(20, self.screen_width - 20)
+        self.y[i] = -50
+        self.speed[i] = speed
+        self.type[i] = self.food_types.index(food_type)
+        self.seq[i] = self.next_seq
+        self.next_seq += 1
+        self.count += 1
+        return int(self.x[i])
+
+    def remove(self, i):
+        """Removes slot i by moving the last live item into it."""
+        last = self.count - 1
+        if i != last:
+            for array in (self.x, self.y, self.speed, self.type, self.seq):
+                array[i] = array[last]
+        self.count = last
+
+    def _remove_many(self, indices):
+        """Removes several slots at once, highest index first so swaps stay valid."""
+        for i in sorted(indices.tolist(), reverse=True):
+            self.remove(i)
+
+    def _centers_y(self):
+        """Integer y centers, rounded the same way pygame.Rect rounds a float center."""
+        y = self.y[:self.count]
+        return np.trunc(y + np.copysign(0.5, y)).astype(np.int64)
+
+    def update(self, speed, catchers, screen_height):
+        """
+        Moves every item down, removes caught and fallen items.
+
+        Parameters:
+        - catchers: list of rects that catch items (normally just the player's rect)
+
+        Returns the type names of the caught items, in the order they spawned.
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        # Fall: every item moves at the current game speed
+        self.speed[:n] = speed
+        self.y[:n] += self.speed[:n]
+
+        # Overlap test of every item's rect against each catcher's rect
+        half = Food.SIZE // 2
+        left = self.x[:n] - half
+        top = self._centers_y() - half
+        hit = np.zeros(n, dtype=bool)
+        for rect in catchers:
+            hit |= ((left < rect.right) & (rect.left < left + Food.SIZE) &
+                    (top < rect.bottom) & (rect.top < top + Food.SIZE))
+        fallen = ~hit & (self.y[:n] > screen_height)
+
+        hit_indices = np.flatnonzero(hit)
+        order = np.argsort(self.seq[hit_indices], kind="stable")
+        caught = [self.food_types[t] for t in self.type[hit_indices[order]]]
+
+        removed = np.flatnonzero(hit | fallen)
+        if len(removed):
+            self._remove_many(removed)
+        return caught
+
+    def rects(self):
+        """Returns a (count, 4) array of item rects as left, top, width, height."""
+        n = self.count
+        half = Food.SIZE // 2
+        out = np.empty((n, 4), dtype=np.int64)
+        out[:, 0] = self.x[:n] - half
+        out[:, 1] = self._centers_y() - half
+        out[:, 2] = Food.SIZE
+        out[:, 3] = Food.SIZE
+        return out
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draws every item with one batched blit. Returns the list of drawn rects.
+
+        Parameters:
+        - alpha: how far the screen is from the previous tick to the last (1 = at the last tick)
+        """
+        if self.count == 0:
+            return []
+        images = [assets.get_image(self.assets_path, f"food_{name}.png", (Food.SIZE, Food.SIZE))
+                  for name in self.food_types]
+        rects = self.rects()
+        if alpha < 1.0:
+            # Draw each item part of the way back towards its previous position
+            rects[:, 1] -= np.rint(self.speed[:self.count] * (1 - alpha)).astype(np.int64)
+        types = self.type[:self.count]
+        return screen.blits([(images[t], (int(r[0]), int(r[1]))) for t, r in zip(types, rects)])
+
+    def clear(self):
+        """Removes every item."""
+        self.count = 0
@@ -0,0 +1,258 @@
+import os
+import queue
+import threading
+import time
+from bisect import insort
+
+# -------------------------
+# --- LEADERBOARD ---
+# -------------------------
+#
+# Every finished game is kept, not just the best one. The scores live in
+# memory in two indexes:
+#
+#   ScoreIndex  how many games ended with each score (a Fenwick tree), so
+#               "what rank is this score" is O(log n) after millions of games
+#   top         the best TOP_K games, sorted, so "top 10" is a slice
+#
+# On disk the leaderboard is an append-only text log, one line per game:
+#
+#   game <score> <unix time>
+#
+# A writer thread does the appending (and an fsync), so a slow disk never
+# freezes a frame at game over. Every COMPACT_EVERY games the writer
+# rewrites the log as the score counts plus the top entries:
+#
+#   count <score> <number of games>
+#   top <score> <unix time>
+#
+# The new log is written to a temporary file and renamed over the old one,
+# so a crash leaves either the old or the new log, never half of one. A line
+# torn by a crash while appending is skipped when the log is read back.
+
+LOG_VERSION = "# SnackLotl leaderboard 1"
+TOP_K = 100            # Best games kept with their time
+COMPACT_EVERY = 1000   # Rewrite the log after this many appended games
+
+
+class ScoreIndex:
+    """Counts games per score in a Fenwick tree (scores are non-negative integers)."""
+
+    def __init__(self, capacity=256):
+        self.tree = [0] * (capacity + 1)   # 1-based; score s lives at index s + 1
+        self.counts = {}                   # score -> games, used to grow the tree and to compact
+        self.total = 0
+
+    def _grow(self, score):
+        """Doubles the tree until `score` fits, rebuilding it from the counts."""
+        capacity = len(self.tree) - 1
+        while score >= capacity:
+            capacity *= 2
+        self.tree = [0] * (capacity + 1)
+        for known, count in self.counts.items():
+            self._add_to_tree(known, count)
+
+    def _add_to_tree(self, score, count):
+        i = score + 1
+        while i < len(self.tree):
+            self.tree[i] += count
+            i += i & -i
+
+    def add(self, score, count=1):
+        if score < 0:
+            raise ValueError(f"Scores cannot be negative: {score}")  # Index 0 would never move on
+        if score >= len(self.tree) - 1:
+            self._grow(score)
+        self.counts[score] = self.counts.get(score, 0) + count
+        self.total += count
+        self._add_to_tree(score, count)
+
+    def at_most(self, score):
+        """Number of games that scored `score` or less."""
+        i = min(score + 1, len(self.tree) - 1)
+        result = 0
+        while i > 0:
+            result += self.tree[i]
+            i -= i & -i
+        return result
+
+    def rank(self, score):
+        """1 + the number of games with a higher score (ties share a rank)."""
+        return 1 + self.total - self.at_most(score)
+
+
+class Leaderboard:
+    """
+    All finished games, indexed in memory and logged to disk on a writer thread.
+
+    Parameters:
+    - path: the log file
+    - legacy_path: an old highscore.txt to import when there is no log yet
+    - top_k: how many of the best games keep their date
+    - compact_every: appended games between two compactions
+    """
+
+    def __init__(self, path, legacy_path=None, top_k=TOP_K, compact_every=COMPACT_EVERY):
+        self.path = path
+        self.top_k = top_k
+        self.compact_every = compact_every
+        self.index = ScoreIndex()
+        self.top = []           # (-score, time) of the best games, best first
+        self.appended = 0       # Game lines in the log since it was last compacted
+        self.skipped_lines = 0  # Lines that could not be read (e.g. torn by a crash)
+        self.torn_tail = False  # The log ends in the middle of a line
+
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, name="leaderboard-writer", daemon=True)
+
+        if os.path.exists(path):
+            self._read_log()
+        elif legacy_path and os.path.exists(legacy_path):
+            self._import_legacy(legacy_path)
+        self.writer.start()
+        if self.appended >= compact_every:
+            self.compact()
+
+    # --- Reading ---
+
+    def _read_log(self):
+        try:
+            with open(self.path, "r") as file:
+                lines = file.readlines()
+        except OSError as error:
+            print("Could not read the leaderboard:", error)
+            return
+        self.torn_tail = bool(lines) and not lines[-1].endswith("\n")
+        for line in lines:
+            if not line.endswith("\n") or line.startswith("#"):
+                continue  # The header, or a line the game was writing when it stopped
+            parts = line.split()
+            try:
+                kind, score, value = parts[0], int(parts[1]), int(parts[2])
+            except (IndexError, ValueError):
+                self.skipped_lines += 1
+                continue
+            if score < 0 or value < 0:
+                self.skipped_lines += 1  # Scores, counts and times are never negative: a corrupt line
+                continue
+            if kind == "game":
+                self._index(score, value)
+                self.appended += 1
+            elif kind == "count":
+                self.index.add(score, value)
+            elif kind == "top":
+                self._add_top(score, value)
+            else:
+                self.skipped_lines += 1
+        if self.skipped_lines:
+            print("Skipped", self.skipped_lines, "unreadable lines in", self.path)
+
+    def _import_legacy(self, legacy_path):
+        """Carries the single score of an old highscore.txt over as one game."""
+        try:
+            with open(legacy_path, "r") as file:
+                score = int(file.read())
+            if score < 0:
+                raise ValueError(f"negative score {score}")
+        except (OSError, ValueError) as error:
+            print("Could not import", legacy_path, "-", error)
+            return
+        self.record(score)
+
+    # --- In-memory indexes ---
+
+    def _add_top(self, score, when):
+        entry = (-score, when)
+        if len(self.top) < self.top_k or entry < self.top[-1]:
+            insort(self.top, entry)
+            del self.top[self.top_k:]
+
+    def _index(self, score, when):
+        self.index.add(score)
+        self._add_top(score, when)
+
+    # --- Queries ---
+
+    @property
+    def games(self):
+        """Number of games on the leaderboard."""
+        return self.index.total
+
+    def high_score(self):
+        return -self.top[0][0] if self.top else 0
+
+    def rank(self, score):
+        """Place a game with this score has among all games (1 = best)."""
+        return self.index.rank(score)
+
+    def top_scores(self, count=10):
+        """The best `count` games as (score, unix time) pairs, best first."""
+        return [(-negative_score, when) for negative_score, when in self.top[:count]]
+
+    # --- Writing ---
+
+    def record(self, score):
+        """
+        Adds a finished game and returns its rank. Never touches the disk itself.
+
+        Parameters:
+        - score: the final score of the game
+        """
+        when = int(time.time())
+        self._index(score, when)
+        self.queue.put(("append", f"game {score} {when}\n"))
+        self.appended += 1
+        if self.appended >= self.compact_every:
+            self.compact()
+        return self.rank(score)
+
+    def compact(self):
+        """Asks the writer to rewrite the log from the current indexes."""
+        lines = [f"count {score} {count}\n" for score, count in sorted(self.index.counts.items())]
+        lines += [f"top {-negative_score} {when}\n" for negative_score, when in self.top]
+        # The copy is taken now, so it holds exactly the games queued before it
+        self.queue.put(("compact", lines))
+        self.appended = 0
+
+    def close(self):
+        """Writes everything still queued and stops the writer thread."""
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+
+    def _write_loop(self):
+        """Runs on the writer thread."""
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            kind, data = job
+            try:
+                if kind == "append":
+                    self._append(data)
+                else:
+                    self._rewrite(data)
+            except OSError as error:
+                print("Could not save the leaderboard:", error)
+
+    def _append(self, line):
+        new_file = not os.path.exists(self.path)
+        with open(self.path, "a") as file:
+            if new_file:
+                file.write(LOG_VERSION + "\n")
+            if self.torn_tail:
+                file.write("\n")  # Finish the torn line so this one starts on its own
+                self.torn_tail = False
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _rewrite(self, lines):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as file:
+            file.write(LOG_VERSION + "\n")
+            file.writelines(lines)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)  # Atomic: readers see the old log or the new one
+        self.torn_tail = False
@@ -0,0 +1,115 @@
+import os
+import threading
+import time
+
+import pygame
+
+import assets
+
+# -------------------------
+# --- BACKGROUND LOADING ---
+# -------------------------
+#
+# Lets the title screen appear right away while the sprites and the music
+# load on a worker thread. The worker only decodes and scales; the finished
+# images are handed to the shared cache on the main thread by poll(), which
+# the game calls once per frame, because converting to the display format
+# belongs on the thread that owns the display.
+
+
+class AssetLoader:
+    """
+    Parameters:
+    - assets_path: folder with the image files
+    - images: (filename, size) pairs to load
+    - music_path: music file to load with pygame.mixer.music, or None
+    - jobs: other functions to run on the worker after the images (e.g. Sfx.load)
+    """
+
+    def __init__(self, assets_path, images, music_path=None, jobs=()):
+        self.assets_path = assets_path
+        # Only images that are not cached yet (e.g. not already in the bundle)
+        self.pending = [(filename, size) for filename, size in images
+                        if not assets.is_cached(assets_path, filename, size)]
+        self.total = len(self.pending) + (1 if music_path else 0) + len(jobs)
+        self.music_path = music_path
+        self.jobs = list(jobs)
+        self.music_loaded = False
+        self.done = 0               # Items finished by the worker
+        self.finished = []          # (filename, size, image) waiting for poll()
+        self.lock = threading.Lock()
+        self.worker_done = threading.Event()
+        self.ready = False          # True once everything is in the cache
+        self.started_at = None
+        self.ready_ms = None        # How long loading took, once ready
+        self.thread = threading.Thread(target=self._work, name="asset-loader", daemon=True)
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self.thread.start()
+        return self
+
+    def _work(self):
+        """Runs on the worker thread: decode and scale every pending image, load the music, run the jobs."""
+        try:
+            for filename, size in self.pending:
+                try:
+                    image = pygame.image.load(os.path.join(self.assets_path, filename))
+                    if size is not None:
+                        image = pygame.transform.scale(image, size)
+                except (pygame.error, OSError) as error:
+                    # Leave it out; the game will load it on first use and report the error there
+                    print("Could not load", filename, "-", error)
+                    image = None
+                with self.lock:
+                    if image is not None:
+                        self.finished.append((filename, size, image))
+                    self.done += 1
+
+            if self.music_path:
+                try:
+                    pygame.mixer.music.load(self.music_path)
+                    self.music_loaded = True
+                except pygame.error as error:
+                    print("Could not load music", self.music_path, "-", error)
+                with self.lock:
+                    self.done += 1
+
+            for job in self.jobs:
+                try:
+                    job()
+                except Exception as error:
+                    # A failed extra (e.g. sound effects) must not keep the game from starting
+                    print("Background loading step failed:", getattr(job, "__qualname__", job), "-", error)
+                with self.lock:
+                    self.done += 1
+        finally:
+            # Always let poll() finish, or the title screen would wait forever
+            self.worker_done.set()
+
+    @property
+    def progress(self):
+        """Fraction of the work done, from 0.0 to 1.0."""
+        return self.done / self.total if self.total else 1.0
+
+    def poll(self):
+        """
+        Moves finished images into the shared cache. Call once per frame on the main thread.
+
+        Returns True on the frame loading finishes.
+        """
+        if self.ready:
+            return False
+        with self.lock:
+            finished, self.finished = self.finished, []
+        for filename, size, image in finished:
+            assets.add_image(self.assets_path, filename, size, image)
+        if self.worker_done.is_set():
+            self.ready = True
+            self.ready_ms = (time.perf_counter() - self.started_at) * 1000
+            return True
+        return False
+
+    def wait(self):
+        """Blocks until the worker is done. The next poll() then finishes loading."""
+        self.thread.join()
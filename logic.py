@@ -1,101 +1,293 @@
 import random
 import pygame
-from player import Player
-from food import Food
+
+from food import FoodPool
+from collision import SweepIndex
+
+# -------------------------
+# --- GAME RULES ---
+# -------------------------
+
+TICK_RATE = 60              # Simulation ticks per second (one tick = one frame at 60 FPS)
+SPAWN_INTERVAL_MS = 1000    # A new food item appears every second
+START_SPEED = 5             # Initial falling speed of food items (pixels per tick)
+SPEED_STEP = 0.5            # Speed added every time the score passes a multiple of 10
+POINTS_PER_SPEED_STEP = 10
+START_LIVES = 3
+PLAYER_SIZE = 160           # Width and height of the axolotl in pixels
+PLAYER_STEP = 10            # Pixels the axolotl moves per tick while a key is held
+PLAYER_OFFSET = 80          # Distance of the axolotl's center from the bottom edge
+FOOD_TYPES = ['shrimp', 'fish', 'toxin']
+
+# Bits of the input mask passed to Game.step()
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+
+# Names of the events reported in Game.events after each step
+EVENT_SPAWN = "spawn"
+EVENT_CATCH = "catch"
+EVENT_TOXIN = "toxin"
+EVENT_LIFE_LOST = "life_lost"   # A toxin cost a life and the game goes on
+EVENT_SPEED_UP = "speed_up"
+EVENT_GAME_OVER = "game_over"
+
+
+class Rules:
+    """
+    The tunable numbers of the game. The defaults are the production values.
+
+    Parameters:
+    - food_weights: relative chance of each food type, or None for equal chances
+    - spawn_interval_ms: time between two spawns in milliseconds of game time
+    - start_speed: falling speed at the start of a game (pixels per tick)
+    - speed_step: speed added every `points_per_speed_step` points
+    - start_lives: lives at the start of a game
+    - player_size: width and height of the player's collision box
+    """
+
+    def __init__(self, food_weights=None, spawn_interval_ms=SPAWN_INTERVAL_MS, start_speed=START_SPEED,
+                 speed_step=SPEED_STEP, points_per_speed_step=POINTS_PER_SPEED_STEP,
+                 start_lives=START_LIVES, player_size=PLAYER_SIZE):
+        self.food_weights = list(food_weights) if food_weights is not None else None
+        self.spawn_interval_ms = spawn_interval_ms
+        self.start_speed = start_speed
+        self.speed_step = speed_step
+        self.points_per_speed_step = points_per_speed_step
+        self.start_lives = start_lives
+        self.player_size = player_size
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+class FoodList:
+    """
+    Keeps falling items as a list of Food objects (the default food store).
+
+    Items come from a FoodPool and go back to it when caught or missed, so no
+    Food objects are created while the game runs. A SweepIndex keeps the items
+    sorted by x, so each catcher only tests the items near it.
+    food_array.FoodArray offers the same methods backed by NumPy arrays.
+    """
+
+    def __init__(self, assets_path, screen_width, food_types, pool_capacity=64):
+        self.assets_path = assets_path
+        self.screen_width = screen_width
+        self.pool = FoodPool(pool_capacity, assets_path, screen_width)
+        self.index = SweepIndex()
+        self.index_keys = {}  # Food -> its key in the index
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def spawn(self, food_type, rng, speed):
+        """Adds one item above the screen at a random horizontal position. Returns its x."""
+        food = self.pool.acquire(food_type, rng)
+        food.speed = speed
+        self.items.append(food)
+        self.index_keys[food] = self.index.add(food.rect)
+        return food.x
+
+    def _release(self, food):
+        """Takes an item out of the index and gives it back to the pool."""
+        self.index.remove(self.index_keys.pop(food))
+        self.pool.release(food)
+
+    def update(self, speed, catchers, screen_height):
+        """
+        Moves every item down, removes caught and fallen items.
+
+        Parameters:
+        - catchers: list of rects that catch items (normally just the player's rect)
+
+        Returns the type names of the caught items, in the order they spawned.
+        """
+        fallen = False
+        for food in self.items:
+            food.speed = speed
+            food.fall()
+            if food.y > screen_height:
+                fallen = True
+
+        # Collision between the catchers and the food: only nearby items are tested
+        hit_ids = {id(rect) for catcher in catchers for rect in self.index.query(catcher)}
+        if not hit_ids and not fallen:
+            return []
+
+        caught = []
+        remaining = []
+        for food in self.items:
+            if id(food.rect) in hit_ids:
+                caught.append(food.type)
+                self._release(food)
+
+            # Remove food if it falls below the screen
+            elif food.y > screen_height:
+                self._release(food)
+
+            else:
+                remaining.append(food)
+        self.items = remaining
+        return caught
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draws every item. Returns the list of drawn rects.
+
+        Parameters:
+        - alpha: how far the screen is from the previous tick to the last (1 = at the last tick)
+        """
+        return [food.draw(screen, round(food.speed * (1 - alpha))) for food in self.items]
+
+    def clear(self):
+        """Removes every item."""
+        for food in self.items:
+            self.pool.release(food)
+        self.items.clear()
+        self.index.clear()
+        self.index_keys.clear()
+
 
 class Game:
-    def __init__(self, width, height, assets_path):
+    """
+    Headless simulation of SnackLotl's rules.
+
+    The game advances one fixed tick per call to step() and never touches the
+    display, fonts or timers, so it can run thousands of ticks per second.
+    All randomness comes from a seeded random.Random, so the same seed and
+    the same inputs always produce the same game.
+    """
+
+    def __init__(self, width=800, height=600, seed=None, high_score=0, food_types=FOOD_TYPES,
+                 assets_path="assets", store="list", rules=None):
         self.width = width
         self.height = height
-        self.assets_path = assets_path
+        self.assets_path = assets_path  # Only used when a renderer draws the food
+        self.food_types = list(food_types)
+        self.high_score = high_score
+        self.rules = rules if rules is not None else Rules()
+        self.spawn_interval = max(1, round(self.rules.spawn_interval_ms * TICK_RATE / 1000))  # in ticks
+
+        # Food store: "list" keeps Food objects, "array" keeps NumPy arrays (needs numpy)
+        if store == "array":
+            from food_array import FoodArray
+            self.foods = FoodArray(assets_path, width, self.food_types)
+        elif store == "list":
+            self.foods = FoodList(assets_path, width, self.food_types)
+        else:
+            raise ValueError(f"Unknown food store: {store}")
+        self.reset(seed)
 
-        # Initialize player at the bottom center of the screen
-        self.player = Player(width // 2, height - 50, 80, assets_path)
+    def reset(self, seed=None):
+        """Starts a new game, keeping the high score."""
+        self.seed = seed
+        self.rng = random.Random(seed)
 
-        # List to hold falling food items
-        self.food_items = []
+        # Player position and collision box (same size as the player's sprite)
+        self.player_x = self.width // 2
+        self.player_y = self.height - PLAYER_OFFSET
+        size = self.rules.player_size
+        self.player_rect = pygame.Rect(0, 0, size, size)
+        self.player_rect.center = (self.player_x, self.player_y)
+        self.catchers = [self.player_rect]  # Rects that catch food; extra catchers may be added
 
-        # Initial values
+        self.foods.clear()           # Food items currently falling
         self.score = 0
-        self.lives = 3
+        self.lives = self.rules.start_lives
+        self.speed = self.rules.start_speed
+        self.last_speed_increase_score = 0
         self.game_over = False
+        self.new_high_score = False  # True once this game has beaten the old high score
+        self.tick = 0
+        self.events = []
+        self.last_spawn = None
 
-        # Font for UI text
-        self.font = pygame.font.SysFont(None, 48)
+    def spawn_food(self):
+        """Spawns one random food item above the screen."""
+        if self.rules.food_weights is None:
+            food_type = self.rng.choice(self.food_types)
+        else:
+            food_type = self.rng.choices(self.food_types, self.rules.food_weights)[0]
+        x = self.foods.spawn(food_type, self.rng, self.speed)
+        self.last_spawn = (food_type, x)  # Type and position of the newest item
+        self.events.append(EVENT_SPAWN)
 
-        # Start with some food on screen
-        self.spawn_food()
+    def move_player(self, dx):
+        """Moves the player horizontally, keeping it inside the screen."""
+        half = self.rules.player_size // 2
+        self.player_x = min(max(self.player_x + dx, half), self.width - half)
+        self.player_rect.center = (self.player_x, self.player_y)
 
-    def spawn_food(self):
-        """Spawns 3 food items (randomly shrimp, fish, or toxin)."""
-        types = ['shrimp', 'fish', 'toxin']
-        self.food_items.clear()  # Clear existing items
-        for _ in range(3):
-            ftype = random.choice(types)
-            food = Food(ftype, self.assets_path, self.width)
-            self.food_items.append(food)
-
-    def update(self, direction):
-        """Updates game logic: player movement, food falling, collisions, lives & score."""
+    def step(self, input_bitmask=0):
+        """
+        Advances the game by one tick.
+
+        Parameters:
+        - input_bitmask: combination of INPUT_LEFT and INPUT_RIGHT held this tick
+
+        Returns the list of events that happened during the tick.
+        """
+        self.events = []
         if self.game_over:
-            return
+            return self.events
+        self.tick += 1
 
-        # Move player left or right
-        if direction == "LEFT":
-            self.player.move(-10)
-        elif direction == "RIGHT":
-            self.player.move(10)
+        # Spawn a random food item every second
+        if self.tick % self.spawn_interval == 0:
+            self.spawn_food()
 
-        # Update each food item
-        for food in self.food_items:
-            food.fall()
+        # Player movement
+        if input_bitmask & INPUT_LEFT:
+            self.move_player(-PLAYER_STEP)
+        if input_bitmask & INPUT_RIGHT:
+            self.move_player(PLAYER_STEP)
 
-            # Check collision between player and food
-            if food.rect.colliderect(self.player.rect):
-                if food.type == 'toxin':
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.game_over = True  # End game if lives are 0
-                else:
-                    self.score += 1  # Collecting good food increases score
-
-                # Respawn food at random position above screen
-                food.x = random.randint(20, self.width - 20)
-                food.y = -50
-                food.rect.center = (food.x, food.y)
-
-            # If food falls off screen, respawn it from the top
-            elif food.y > self.height + 20:
-                food.x = random.randint(20, self.width - 20)
-                food.y = -50
-                food.rect.center = (food.x, food.y)
-
-    def draw(self, screen):
-        """Draws the entire game state: background, player, food, score, lives, game over screen."""
-        # Draw background
-        bg = pygame.image.load(f"{self.assets_path}/background.jpg")
-        bg = pygame.transform.scale(bg, (self.width, self.height))
-        screen.blit(bg, (0, 0))
-
-        # Draw food items
-        for food in self.food_items:
-            food.draw(screen)
-
-        # Draw player
-        self.player.draw(screen)
-
-        # Draw UI (score and lives)
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        lives_text = self.font.render(f"Lives: {self.lives}", True, (255, 255, 255))
-        screen.blit(score_text, (10, 10))
-        screen.blit(lives_text, (10, 60))
-
-        # If game is over, show end screen text
-        if self.game_over:
-            over_text = self.font.render("GAME OVER", True, (255, 20, 147))
-            rect = over_text.get_rect(center=(self.width // 2, self.height // 2 - 30))
-            screen.blit(over_text, rect)
+        # Increase speed gradually every 10 points scored
+        points_per_step = self.rules.points_per_speed_step
+        if self.score // points_per_step > self.last_speed_increase_score:
+            self.speed += self.rules.speed_step
+            self.last_speed_increase_score = self.score // points_per_step
+            self.events.append(EVENT_SPEED_UP)
+
+        # Move all food items and handle the ones the player caught
+        for food_type in self.foods.update(self.speed, self.catchers, self.height):
+            if food_type == 'toxin':
+                # Toxins reduce player's life
+                self.lives -= 1
+                self.events.append(EVENT_TOXIN)
+                if self.lives <= 0 and not self.game_over:
+                    self.end_game()
+                elif not self.game_over:
+                    self.events.append(EVENT_LIFE_LOST)
+            else:
+                # Normal food increases score
+                self.score += 1
+                self.events.append(EVENT_CATCH)
+
+        return self.events
+
+    def end_game(self):
+        """Marks the game as over and updates the high score."""
+        self.game_over = True
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self.new_high_score = True
+        self.events.append(EVENT_GAME_OVER)
+
+    def run(self, ticks, policy=None):
+        """
+        Runs the game for up to `ticks` ticks or until it is over.
+
+        Parameters:
+        - policy: function taking the game and returning an input mask (default: no input)
 
-            msg_text = self.font.render("Press R to Restart or Q to Quit", True, (255, 255, 255))
-            msg_rect = msg_text.get_rect(center=(self.width // 2, self.height // 2 + 30))
-            screen.blit(msg_text, msg_rect)
+        Returns the number of ticks that were simulated.
+        """
+        start = self.tick
+        while not self.game_over and self.tick - start < ticks:
+            self.step(policy(self) if policy else 0)
+        return self.tick - start
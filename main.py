@@ -1,28 +1,83 @@
 # Import required modules
 import pygame   # Library for creating games and multimedia applications
 import sys      # System-specific parameters and functions (used here to quit the program)
-import random   # Module to generate random numbers or selections
 import os       # Operating system interfaces for file handling
+import random   # Random seeds for recorded games
+import time     # Startup timing
 
-# Import custom classes for player and food objects
+# Import custom classes for player and game rules
 from player import Player
-from food import Food
+from logic import Game, TICK_RATE, INPUT_LEFT, INPUT_RIGHT, EVENT_CATCH, EVENT_GAME_OVER
+from render import make_renderer, Window
+import text_cache  # Cache of rendered text surfaces
+import profiler    # Opt-in per-phase frame timings
+import replay      # Recording and playing back games
+import assets   # Shared image cache used by every sprite
+import bundle   # Pre-scaled sprites packed into one file
+from loader import AssetLoader  # Loads sprites and music while the title screen is up
+from leaderboard import Leaderboard  # All scores, saved on a background thread
+import sfx      # Sound effects on a pool of mixer channels
 
 # -------------------------
 # --- GAME CONFIGURATION ---
 # -------------------------
 
-WIDTH, HEIGHT = 800, 600       # Set window size: width and height in pixels
-FPS = 60                      # Frames per second (how many times the screen updates each second)
+WIDTH, HEIGHT = 800, 600       # Logical screen size: the game is always drawn at this size
+WINDOW = os.environ.get("SNACKLOTL_WINDOW")  # Window size like "1920x1080", or "fullscreen" (default: 800x600)
+SCALE_MODE = os.environ.get("SNACKLOTL_SCALE", "fit")  # "integer" scales by whole numbers only (sharper, wider bars)
+FPS = 60                       # Frames drawn per second while playing (0 = no limit)
+FPS_SETTING = os.environ.get("SNACKLOTL_FPS")  # Overrides FPS, e.g. "144" on fast displays
+IDLE_FPS = 30                  # Frames per second on the menu screens, which hardly change
+MAX_FRAME_TIME = 0.25          # Longest frame the game catches up on; after a longer stall it just continues
 ASSETS_PATH = "assets"         # Folder where all game images and sounds are stored
 FONT_COLOR = (255, 255, 255)   # White color for all text (RGB format)
 FOOD_TYPES = ['shrimp', 'fish', 'toxin']  # Different types of food items in the game
-HIGHSCORE_FILE = "highscore.txt"           # File to save and load the highest score
+HIGHSCORE_FILE = "highscore.txt"           # Old single high score file, imported into the leaderboard once
+LEADERBOARD_FILE = "leaderboard.log"       # Every finished game's score
+RENDER_MODE = os.environ.get("SNACKLOTL_RENDER", "dirty")   # "full" redraws and flips the whole screen each frame
+FOOD_STORE = os.environ.get("SNACKLOTL_FOOD_STORE", "list")  # "array" uses the NumPy store for stress modes
+LOADING_COLOR = (10, 40, 70)   # Deep-sea blue shown until the background image is loaded
+
+# Images decoded once at startup, as (filename, size) pairs
+GAME_IMAGES = [("background.jpg", (WIDTH, HEIGHT))] + \
+              [(f"axolotl_{i}.png", (160, 160)) for i in range(1, 5)] + \
+              [(f"food_{name}.png", (100, 100)) for name in FOOD_TYPES]
+# Larger copies used only on the 'How to Play' screen
+MENU_IMAGES = [("axolotl_1.png", (140, 140))] + \
+              [(f"food_{name}.png", (110, 110)) for name in FOOD_TYPES]
 
 # -------------------------
 # --- UTILITY FUNCTIONS ---
 # -------------------------
 
+def parse_window_size(text):
+    """'1920x1080' -> (1920, 1080); 'fullscreen' stays as it is; None or an invalid value means the logical size."""
+    if not text:
+        return None
+    if text.lower() == "fullscreen":
+        return "fullscreen"
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        width = height = 0
+    if width <= 0 or height <= 0:
+        print(f"Ignoring SNACKLOTL_WINDOW={text!r}: expected a size like 1920x1080, or fullscreen")
+        return None
+    return width, height
+
+def parse_fps(text, default):
+    """'144' -> 144; '0' means no frame rate limit. Missing or invalid values give `default`."""
+    if text is None:
+        return default
+    try:
+        fps = int(text)
+    except ValueError:
+        fps = -1
+    if fps < 0:
+        print(f"Ignoring SNACKLOTL_FPS={text!r}: expected a whole number (0 means no limit)")
+        return default
+    return fps
+
 def draw_text(screen, text, font, color, x, y, center=True):
     """
     Draws text on the screen.
@@ -34,282 +89,490 @@ def draw_text(screen, text, font, color, x, y, center=True):
     - color: RGB tuple for text color
     - x, y: position coordinates on the screen
     - center: if True, position is the center of the text; if False, position is top-left corner
+
+    Returns the screen area that was drawn on.
     """
-    surface = font.render(text, True, color)   # Render the text to a new surface
+    surface = text_cache.cache.render(text, font, color)  # Render the text once, then reuse it
     rect = surface.get_rect()                   # Get the rectangular area of the text surface
     if center:
         rect.center = (x, y)                    # Center the rectangle on (x, y)
     else:
         rect.topleft = (x, y)                   # Place the top-left corner at (x, y)
-    screen.blit(surface, rect)                   # Draw the text surface onto the screen
+    return screen.blit(surface, rect)            # Draw the text surface onto the screen
 
 def draw_text_with_outline(screen, text, font, text_color, outline_color, x, y, center=True):
     """
     Draws text with an outline to improve readability against any background.
     
-    This function draws the text multiple times slightly offset in different directions 
-    to create an outline effect, then draws the main text on top.
-    """
-    base = font.render(text, True, text_color)       # The main text surface
-    outline = font.render(text, True, outline_color) # The outline text surface
+    The outline is the text drawn slightly offset in four directions behind the
+    main text. All five copies are composited once into one cached surface.
 
-    rect = base.get_rect()
+    Returns the screen area that was drawn on.
+    """
+    surface = text_cache.cache.render(text, font, text_color, outline_color)
+    rect = surface.get_rect()
     if center:
         rect.center = (x, y)
     else:
-        rect.topleft = (x, y)
-
-    # Draw outline by blitting the outline text in four directions around the main text
-    for dx in [-1, 1]:
-        for dy in [-1, 1]:
-            outline_rect = rect.copy()
-            outline_rect.move_ip(dx, dy)  # Move outline position by (dx, dy)
-            screen.blit(outline, outline_rect)
+        rect.topleft = (x - 1, y - 1)  # The outline adds one pixel on each side
 
-    screen.blit(base, rect)  # Draw the main text on top
+    return screen.blit(surface, rect)
 
-def load_high_score():
-    """
-    Reads the highest score from the highscore file.
-    
-    Returns:
-    - The stored high score as an integer.
-    - Returns 0 if the file doesn't exist or contains invalid data.
-    """
-    if os.path.exists(HIGHSCORE_FILE):
-        try:
-            with open(HIGHSCORE_FILE, "r") as file:
-                return int(file.read())  # Read and convert the score to integer
-        except:
-            return 0  # Return 0 if the file is corrupted or data is not an integer
-    return 0  # Return 0 if the file does not exist
-
-def save_high_score(score):
-    """
-    Saves the new highest score to the highscore file.
-    
-    Parameters:
-    - score: the integer score to save
-    """
-    with open(HIGHSCORE_FILE, "w") as file:
-        file.write(str(score))  # Convert the score to string and write it
-
-def how_to_play(screen, font, background, assets_path):
+# -------------------------
+# --- SCENES ---
+# -------------------------
+#
+# Each screen of the game is a scene: title -> how to play -> playing -> game over.
+# The App below owns the window, the assets and the game for the whole life of
+# the program; scenes only read input and draw. Restarting from the game over
+# screen just resets the game state and switches back to the playing scene.
+
+class Scene:
+    """One screen of the game. Subclasses override the methods they need."""
+
+    idle = True  # Drawn at IDLE_FPS; only the playing scene needs the full frame rate
+
+    def __init__(self, app):
+        self.app = app
+
+    def handle_event(self, event):
+        """Reacts to a single pygame event (key presses etc.)."""
+
+    def update(self):
+        """Advances the scene by one frame."""
+
+    def draw(self, screen):
+        """Draws the scene. Returns the list of drawn rects."""
+        return []
+
+
+class TitleScene(Scene):
+    def handle_event(self, event):
+        # The game can only start once everything has loaded
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE and self.app.assets_ready:
+            self.app.change_scene("how_to_play")
+
+    def draw(self, screen):
+        app = self.app
+        soft_pink = (255, 153, 204)  # Soft pink color for title
+        return [
+            # Draw the game title with an outline and subtitles below
+            draw_text_with_outline(screen, "SnackLotl", app.title_font, soft_pink, (0, 0, 0), WIDTH // 2, HEIGHT // 2 - 80),
+            draw_text(screen, "An underwater axolotl food journey", app.font, FONT_COLOR, WIDTH // 2, HEIGHT // 2),
+            draw_text(screen, "Press SPACE to learn how to play SnackLotl!" if app.assets_ready else
+                      f"Loading... {int(app.loader.progress * 100)}%", app.font, FONT_COLOR, WIDTH // 2, HEIGHT // 2 + 60),
+
+            # *** Creator credit at bottom-left ***
+            draw_text(screen, "Created by Hülya Ceren Lüleci", app.font, (180, 180, 180), 10, HEIGHT - 30, center=False),
+        ]
+
+
+class HowToPlayScene(Scene):
+    """Explains the controls and the food items; SPACE starts the game."""
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            # The menu-sized copies are not needed during play
+            assets.evict_unused(GAME_IMAGES)
+            self.app.start_game()
+
+    def draw(self, screen):
+        app = self.app
+        font = app.font
+        soft_pink = (255, 105, 180)  # Color used for header text
+
+        # Get the scaled images for the player character and food items from the cache
+        axolotl = assets.get_image(ASSETS_PATH, "axolotl_1.png", (140, 140))
+        shrimp = assets.get_image(ASSETS_PATH, "food_shrimp.png", (110, 110))
+        fish = assets.get_image(ASSETS_PATH, "food_fish.png", (110, 110))
+        toxin = assets.get_image(ASSETS_PATH, "food_toxin.png", (110, 110))
+
+        return [
+            # Draw header text centered at the top
+            draw_text(screen, "HOW TO PLAY", app.header_font, soft_pink, WIDTH // 2, 100),
+
+            # Draw player character and control instructions
+            screen.blit(axolotl, (80, 180)),
+            draw_text(screen, "Use A / D or Left / Right", font, FONT_COLOR, 50, 330, center=False),
+            draw_text(screen, "arrow keys to move", font, FONT_COLOR, 50, 360, center=False),
+
+            # Draw food items and their effects
+            screen.blit(shrimp, (300, 180)),
+            draw_text(screen, "+1 point", font, FONT_COLOR, 355, 310),
+            screen.blit(fish, (440, 180)),
+            draw_text(screen, "+1 point", font, FONT_COLOR, 495, 310),
+            screen.blit(toxin, (580, 180)),
+            draw_text(screen, "-1 life!", font, FONT_COLOR, 635, 310),
+
+            # Additional instructions at the bottom
+            draw_text(screen, "Collect snacks. Avoid toxins.", font, FONT_COLOR, WIDTH // 2, 440),
+            draw_text(screen, "Press SPACE to START", font, FONT_COLOR, WIDTH // 2, 500),
+
+            # *** Creator credit at bottom-left ***
+            draw_text(screen, "Created by Hülya Ceren Lüleci", font, (180, 180, 180), 10, HEIGHT - 30, center=False),
+        ]
+
+
+class PlayingScene(Scene):
     """
-    Displays the 'How to Play' screen explaining game controls and mechanics.
-    
-    The player can read instructions and press SPACE to start the game.
+    The game itself: the rules run in logic.Game, this scene feeds input and draws.
+
+    The rules always advance in fixed ticks of 1/TICK_RATE seconds, however
+    fast or slow frames are drawn. Each frame adds the real time that passed
+    to an accumulator and runs as many whole ticks as fit into it. What is
+    left over says how far the screen is between the last two ticks, and
+    the items and the player are drawn that far along their way. On a slow
+    machine the game runs several ticks per frame instead of slowing down;
+    on a 144 Hz display the movement is smooth instead of jumping every
+    few frames.
     """
-    # Load and scale images for the player character and food items
-    axolotl = pygame.image.load(os.path.join(assets_path, "axolotl_1.png"))
-    shrimp = pygame.image.load(os.path.join(assets_path, "food_shrimp.png"))
-    fish = pygame.image.load(os.path.join(assets_path, "food_fish.png"))
-    toxin = pygame.image.load(os.path.join(assets_path, "food_toxin.png"))
-
-    axolotl = pygame.transform.scale(axolotl, (140, 140))
-    shrimp = pygame.transform.scale(shrimp, (110, 110))
-    fish = pygame.transform.scale(fish, (110, 110))
-    toxin = pygame.transform.scale(toxin, (110, 110))
-
-    soft_pink = (255, 105, 180)                    # Color used for header text
-    header_font = pygame.font.SysFont(None, 44)   # Font used for the header
-
-    # Main loop to keep the instruction screen visible until user presses SPACE or closes window
-    while True:
-        screen.blit(background, (0, 0))  # Draw the background image
-
-        # Draw header text centered at the top
-        draw_text(screen, "HOW TO PLAY", header_font, soft_pink, WIDTH // 2, 100)
-
-        # Draw player character and control instructions
-        screen.blit(axolotl, (80, 180))
-        draw_text(screen, "Use A / D or Left / Right", font, FONT_COLOR, 50, 330, center=False)
-        draw_text(screen, "arrow keys to move", font, FONT_COLOR, 50, 360, center=False)
-
-        # Draw food items and their effects
-        screen.blit(shrimp, (300, 180))
-        draw_text(screen, "+1 point", font, FONT_COLOR, 355, 310)
-
-        screen.blit(fish, (440, 180))
-        draw_text(screen, "+1 point", font, FONT_COLOR, 495, 310)
 
-        screen.blit(toxin, (580, 180))
-        draw_text(screen, "-1 life!", font, FONT_COLOR, 635, 310)
+    idle = False
+    TICK_SECONDS = 1 / TICK_RATE
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.reset_timing()
+
+    def reset_timing(self):
+        """Starts a new game's clock with nothing left to simulate."""
+        self.accumulator = 0.0          # Real time not simulated yet, in seconds
+        self.alpha = 1.0                # How far the screen is from the previous tick to the last (0 to 1)
+        self.previous_player_x = None   # Player position before the last tick
+
+    def update(self):
+        app = self.app
+        if app.uncapped:
+            # Fast replays (and the soak test): one tick per frame, as fast as the CPU allows
+            self.tick()
+            self.alpha = 1.0
+            return
+
+        self.accumulator += app.frame_time
+        while self.accumulator >= self.TICK_SECONDS and app.scene is self:
+            self.tick()
+            self.accumulator -= self.TICK_SECONDS
+        self.alpha = self.accumulator / self.TICK_SECONDS
+
+    def tick(self):
+        """Runs one tick of the game rules."""
+        app = self.app
+        input_mask = app.read_input()
+        app.profiler.lap("input")
+        if input_mask is None:
+            # A replay ran out of recorded input
+            app.change_scene("game_over")
+            return
+
+        # Advance the game rules by one tick and react to what happened
+        self.previous_player_x = app.game.player_x
+        events = app.game.step(input_mask)
+        if app.recorder:
+            app.recorder.record(input_mask)
+        app.player.update()  # The eating animation also counts ticks, not frames
+        app.sfx.play_events(events)  # Sounds are already in memory, so this never waits
+        for game_event in events:
+            if game_event == EVENT_CATCH:
+                app.player.trigger_animation()  # Play player eating animation
+            elif game_event == EVENT_GAME_OVER:
+                if app.replay_inputs is None:
+                    # Save the score (on the leaderboard's own thread, so this frame is not held up)
+                    app.last_rank = app.leaderboard.record(app.game.score)
+                app.stop_recording()
+                app.stop_replay()
+                app.change_scene("game_over")
+        app.profiler.lap("update")
+
+    def draw(self, screen):
+        app = self.app
+        alpha = self.alpha
+        # Draw all food items, each between its last two positions
+        rects = app.game.foods.draw(screen, alpha)
+
+        # Draw the player character between its last two simulated positions
+        x = app.game.player_x
+        if self.previous_player_x is not None:
+            x = round(self.previous_player_x + (x - self.previous_player_x) * alpha)
+        app.player.place(x)
+        rects.append(app.player.draw(screen))
+        app.profiler.lap("draw")
+
+        # Draw game stats on screen (re-rendered only when a value changes)
+        app.hud.update(app.game.score, app.game.lives, app.game.high_score)
+        rects.extend(app.hud.draw(screen))
+        app.profiler.lap("hud")
+        return rects
+
+
+class GameOverScene(Scene):
+    def handle_event(self, event):
+        # After game over, listen for restart or quit commands
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                self.app.restart()
+            elif event.key == pygame.K_q:
+                self.app.quit()
+
+    def draw(self, screen):
+        app = self.app
+        font = app.font
+        # Display game over screen with final score and instructions
+        rects = [
+            draw_text(screen, "GAME OVER", font, (255, 0, 128), WIDTH//2, HEIGHT//2 - 60),
+            draw_text(screen, f"Final Score: {app.game.score}", font, FONT_COLOR, WIDTH//2, HEIGHT//2 + 10),
+            draw_text(screen, f"High Score: {app.game.high_score}", font, FONT_COLOR, WIDTH//2, HEIGHT//2 + 50),
+            draw_text(screen, "Press R to Restart or Q to Quit", font, FONT_COLOR, WIDTH//2, HEIGHT//2 + 130),
+
+            # *** Creator credit at bottom-left ***
+            draw_text(screen, "Created by Hülya Ceren Lüleci", font, (180, 180, 180), 10, HEIGHT - 30, center=False),
+        ]
+        # Place of this game among all games ever played (not shown for replays)
+        if app.last_rank:
+            rects.append(draw_text(screen, f"Rank: #{app.last_rank} of {app.leaderboard.games} games",
+                                   font, FONT_COLOR, WIDTH//2, HEIGHT//2 + 90))
+        return rects
 
-        # Additional instructions at the bottom
-        draw_text(screen, "Collect snacks. Avoid toxins.", font, FONT_COLOR, WIDTH // 2, 440)
-        draw_text(screen, "Press SPACE to START", font, FONT_COLOR, WIDTH // 2, 500)
 
-        # *** Creator credit at bottom-left ***
-        draw_text(screen, "Created by Hülya Ceren Lüleci", font, (180, 180, 180), 10, HEIGHT - 30, center=False)
-
-        pygame.display.flip()  # Update the full display
-
-        # Handle user events such as quitting or pressing keys
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()  # Quit pygame properly
-                sys.exit()     # Exit the program
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                return  # Exit this function and start the game
 # -------------------------
 # --- MAIN GAME FUNCTION ---
 # -------------------------
 
-def main():
-    # Initialize all imported pygame modules (graphics, sound, etc.)
-    pygame.init()
-    pygame.mixer.init()  # Initialize sound mixer
-
-    # Set up the main game window with specified width and height
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("SnackLotl")  # Set window title
-    clock = pygame.time.Clock()  # Create a clock to control frame rate
-    font = pygame.font.SysFont(None, 36)  # Default font for game text
-
-    # Load and scale background image to fit window size
-    background = pygame.image.load(os.path.join(ASSETS_PATH, "background.jpg"))
-    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-    # Load background music if it exists, and start playing it on loop
-    music_path = os.path.join(ASSETS_PATH, "music.ogg")
-    if os.path.exists(music_path):
-        pygame.mixer.music.load(music_path)
-        pygame.mixer.music.set_volume(1.0)  # Max volume
-        pygame.mixer.music.play(-1)  # Loop indefinitely
-    else:
-        print("Music file not found:", music_path)
-
-    # Variables for the start screen
-    in_start_screen = True
-    title_font = pygame.font.SysFont(None, 80)  # Larger font for title
-    sub_font = pygame.font.SysFont(None, 36)    # Subtitle font
-    soft_pink = (255, 153, 204)                  # Soft pink color for title
-
-    # Start screen loop — waits for player to press SPACE to continue
-    while in_start_screen:
-        screen.blit(background, (0, 0))  # Draw background image
-
-        # Draw the game title with an outline and subtitles below
-        draw_text_with_outline(screen, "SnackLotl", title_font, soft_pink, (0, 0, 0), WIDTH // 2, HEIGHT // 2 - 80)
-        draw_text(screen, "An underwater axolotl food journey", sub_font, FONT_COLOR, WIDTH // 2, HEIGHT // 2)
-        draw_text(screen, "Press SPACE to learn how to play SnackLotl!", sub_font, FONT_COLOR, WIDTH // 2, HEIGHT // 2 + 60)
+class App:
+    """
+    Owns the window, fonts, images, music and game state for the life of the program.
 
-         # *** Creator credit at bottom-left ***
-        draw_text(screen, "Created by Hülya Ceren Lüleci", font, (180, 180, 180), 10, HEIGHT - 30, center=False)
+    Everything here is created once; restarting only resets the game state.
+    """
 
-        pygame.display.flip()  # Update display to show these changes
+    def __init__(self, frame_profiler, record_path=None, replay_path=None, uncapped=False, policy=None):
+        self.started_at = time.perf_counter()
+        self.first_frame_ms = None      # Time from here to the first frame on screen
+        self.profiler = frame_profiler
+        self.record_path = record_path  # Record every game to this replay file (numbered per game)
+        self.recorder = None
+        self.replay_reader = None       # Open replay file being played back
+        self.replay_inputs = None       # Recorded inputs being played back instead of the keyboard
+        self.policy = policy            # Scripted player (see policies.py) used instead of the keyboard
+        self.uncapped = uncapped        # Run one game tick per frame with no frame rate limit (fast replays)
+        self.fps = 0 if uncapped else parse_fps(FPS_SETTING, FPS)  # 0 means no frame rate limit; the game still runs at TICK_RATE
+        self.frame_time = 0.0                # Seconds since the previous frame
+        self.last_frame_at = time.perf_counter()
+
+        # Initialize all imported pygame modules (graphics, sound, etc.)
+        sfx.pre_init()  # Small mixer buffer so sound effects start quickly
+        pygame.init()
+        pygame.mixer.init()  # Initialize sound mixer
+
+        # Set up the main game window; every scene draws on the logical WIDTH x HEIGHT screen
+        self.window = Window((WIDTH, HEIGHT), parse_window_size(WINDOW), integer=SCALE_MODE == "integer")
+        self.screen = self.window.surface
+        pygame.display.set_caption("SnackLotl")  # Set window title
+        self.clock = pygame.time.Clock()  # Create a clock to control frame rate
+        self.font = pygame.font.SysFont(None, 36)          # Default font for game text
+        self.title_font = pygame.font.SysFont(None, 80)    # Larger font for title
+        self.header_font = pygame.font.SysFont(None, 44)   # Font used for the 'How to Play' header
+        self.overlay_font = pygame.font.SysFont(None, 22)  # Small font for the profiler overlay
+
+        # Take the pre-scaled sprites from the bundle if it is up to date (a few milliseconds)
+        bundle.load(ASSETS_PATH)
+        if assets.is_cached(ASSETS_PATH, "background.jpg", (WIDTH, HEIGHT)):
+            self.background = assets.get_image(ASSETS_PATH, "background.jpg", (WIDTH, HEIGHT))
+        else:
+            # Plain color until the worker thread has decoded the background
+            self.background = pygame.Surface((WIDTH, HEIGHT)).convert()
+            self.background.fill(LOADING_COLOR)
+
+        # Decode whatever is still missing, and the background music, on a worker thread
+        music_path = os.path.join(ASSETS_PATH, "music.ogg")
+        if not os.path.exists(music_path):
+            print("Music file not found:", music_path)
+            music_path = None
+        self.sfx = sfx.Sfx(ASSETS_PATH)
+        self.loader = AssetLoader(ASSETS_PATH, GAME_IMAGES + MENU_IMAGES, music_path, jobs=[self.sfx.load]).start()
+        self.player = None  # Created once its animation frames are loaded
+
+        # Every finished game's score; reading it is quick, saving happens on its own thread
+        self.leaderboard = Leaderboard(LEADERBOARD_FILE, legacy_path=HIGHSCORE_FILE)
+        self.last_rank = None  # Rank of the game that just ended
+
+        # Initialize game objects
+        # The rules live in logic.Game; the playing scene only reads input and draws its state
+        if replay_path:
+            # Same seed, rules and inputs as the recorded game
+            self.replay_reader = reader = replay.ReplayReader(replay_path)
+            self.game = reader.make_game(high_score=self.leaderboard.high_score(), assets_path=ASSETS_PATH, store=FOOD_STORE)
+            self.replay_inputs = reader.inputs()
+        else:
+            self.game = Game(WIDTH, HEIGHT, high_score=self.leaderboard.high_score(), food_types=FOOD_TYPES,
+                             assets_path=ASSETS_PATH, store=FOOD_STORE)
+        self.hud = text_cache.Hud(self.font, FONT_COLOR, WIDTH)  # Score, lives and high score labels
+        self.renderer = make_renderer(RENDER_MODE, self.screen, self.background, self.window)  # Redraws only what changed
+
+        self.scenes = {
+            "title": TitleScene(self),
+            "how_to_play": HowToPlayScene(self),
+            "playing": PlayingScene(self),
+            "game_over": GameOverScene(self),
+        }
+        self.scene = self.scenes["playing" if replay_path else "title"]
+        self.restarts = 0
+        self.games_recorded = 0
+
+        if replay_path:
+            # A replay starts playing right away, so it needs everything loaded before the first frame
+            self.loader.wait()
+
+    @property
+    def assets_ready(self):
+        """True once all sprites and the music have loaded."""
+        return self.loader.ready
+
+    def on_assets_ready(self):
+        """Called once, on the frame the background loader finishes."""
+        self.background = assets.get_image(ASSETS_PATH, "background.jpg", (WIDTH, HEIGHT))
+        self.renderer.background = self.background
+        self.renderer.invalidate()
+        self.player = Player(WIDTH // 2, HEIGHT - 80, 160, ASSETS_PATH, WIDTH)  # Player sprite near bottom center
+
+        # Start the background music on loop
+        if self.loader.music_loaded:
+            pygame.mixer.music.set_volume(1.0)  # Max volume
+            pygame.mixer.music.play(-1)  # Loop indefinitely
+
+        if self.profiler.enabled:
+            print(f"Startup: assets loaded after {self.loader.ready_ms:.0f} ms")
+
+    def change_scene(self, name):
+        """Switches to another scene; the next frame is a full redraw."""
+        self.scene = self.scenes[name]
+        self.renderer.invalidate()
+
+    def start_game(self):
+        """Starts a new game without reloading anything."""
+        self.stop_replay()
+        if self.record_path:
+            # A recorded game needs a known seed so it can be replayed
+            self.game.reset(random.randrange(2 ** 62))
+            path = replay.numbered_path(self.record_path, self.games_recorded)
+            self.recorder = replay.ReplayWriter(path, self.game)
+            self.games_recorded += 1
+        else:
+            self.game.reset()
+        self.player.reset(WIDTH // 2)
+        self.scenes["playing"].reset_timing()
+        self.change_scene("playing")
+
+    def restart(self):
+        self.restarts += 1
+        self.start_game()
+
+    def read_input(self):
+        """
+        Returns the input bitmask for this tick.
+
+        Comes from the keyboard, the replay being played back (None once
+        the replay has no more input), or the scripted player.
+        """
+        if self.replay_inputs is not None:
+            input_mask = next(self.replay_inputs, None)
+            if input_mask is None:
+                self.stop_replay()
+            return input_mask
+        if self.policy is not None:
+            return self.policy(self.game)
+        keys = pygame.key.get_pressed()  # Get current keyboard state
+        input_mask = 0
+        # Player movement controls: left and right arrows or A/D keys
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            input_mask |= INPUT_LEFT
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            input_mask |= INPUT_RIGHT
+        return input_mask
+
+    def stop_recording(self):
+        """Finishes the replay file of the current game, if one is being recorded."""
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+
+    def stop_replay(self):
+        """Closes the replay file being played back, if any; the keyboard takes over again."""
+        self.replay_inputs = None
+        if self.replay_reader:
+            self.replay_reader.close()
+            self.replay_reader = None
+
+    def quit(self):
+        self.stop_recording()
+        self.stop_replay()
+        self.leaderboard.close()  # Finish writing any queued scores
+        if self.profiler.enabled:
+            print(self.sfx.summary())
+        pygame.quit()  # Quit pygame properly
+        sys.exit()     # Exit the program
+
+    def run_frame(self):
+        """Handles input, updates and draws one frame."""
+        self.profiler.start_frame()
+        now = time.perf_counter()
+        self.frame_time = min(now - self.last_frame_at, MAX_FRAME_TIME)
+        self.last_frame_at = now
+
+        # Pick up images finished by the background loader
+        if self.loader.poll():
+            self.on_assets_ready()
 
-        # Event handling for quitting or starting the game
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:  # User clicks close button
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                in_start_screen = False  # Exit start screen loop
-
-    # Show instructions screen before game begins
-    how_to_play(screen, font, background, ASSETS_PATH)
-
-    # Initialize game objects and variables
-    player = Player(WIDTH // 2, HEIGHT - 80, 160, ASSETS_PATH)  # Player starts near bottom center
-    foods = []               # List to hold food objects falling from top
-    score = 0                # Player's current score
-    lives = 3                # Player's remaining lives
-    game_over = False        # Flag to indicate game over state
-    high_score = load_high_score()  # Load saved high score from file
-    speed = 5                # Initial falling speed of food items
-    spawn_event = pygame.USEREVENT + 1  # Custom event for spawning food
-    pygame.time.set_timer(spawn_event, 1000)  # Trigger spawn_event every 1000 ms (1 second)
-    last_speed_increase_score = 0  # Track when speed last increased based on score
-
-    # Main game loop
-    while True:
         # Event handling loop
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:  # Quit the game window
-                pygame.quit()
-                sys.exit()
-            if event.type == spawn_event and not game_over:
-                # Spawn a random food item every second
-                food_type = random.choice(FOOD_TYPES)
-                food = Food(food_type, ASSETS_PATH, WIDTH)
-                food.SPEED = speed
-                foods.append(food)
-            if event.type == pygame.KEYDOWN and game_over:
-                # After game over, listen for restart or quit commands
-                if event.key == pygame.K_r:
-                    return main()  # Restart the game by calling main() again
-                elif event.key == pygame.K_q:
-                    pygame.quit()
-                    sys.exit()
-
-        keys = pygame.key.get_pressed()  # Get current keyboard state
-        if not game_over:
-            # Player movement controls: left and right arrows or A/D keys
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                player.move(-10)  # Move player left by 10 pixels
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                player.move(10)   # Move player right by 10 pixels
-
-        # Draw the background image
-        screen.blit(background, (0, 0))
-
-        if not game_over:
-            # Increase speed gradually every 10 points scored
-            if score // 10 > last_speed_increase_score:
-                speed += 0.5
-                last_speed_increase_score = score // 10
-
-            # Update and draw all food items
-            for food in foods[:]:  # Iterate over a copy to allow safe removal
-                food.SPEED = speed
-                food.fall()          # Make food fall down the screen
-                food.draw(screen)    # Draw food on the screen
-
-                # Check collision between player and food
-                if food.rect.colliderect(player.rect):
-                    if food.type == 'toxin':
-                        # Toxins reduce player's life
-                        lives -= 1
-                        foods.remove(food)
-                        if lives <= 0:
-                            # Trigger game over if no lives left
-                            game_over = True
-                            if score > high_score:
-                                high_score = score  # Update high score
-                                save_high_score(score)  # Save new high score
-                    else:
-                        # Normal food increases score
-                        score += 1
-                        foods.remove(food)
-                        player.trigger_animation()  # Play player eating animation
-
-                # Remove food if it falls below the screen
-                elif food.y > HEIGHT:
-                    foods.remove(food)
-
-            # Update and draw the player character
-            player.update()
-            player.draw(screen)
-
-            # Draw game stats on screen
-            draw_text(screen, f"Score: {score}", font, FONT_COLOR, 10, 10, center=False)
-            draw_text(screen, f"Lives: {lives}", font, FONT_COLOR, 10, 50, center=False)
-            draw_text(screen, f"High Score: {high_score}", font, FONT_COLOR, WIDTH - 200, 10, center=False)
-
-        else:
-            # Display game over screen with final score and instructions
-            draw_text(screen, "GAME OVER", font, (255, 0, 128), WIDTH//2, HEIGHT//2 - 60)
-            draw_text(screen, f"Final Score: {score}", font, FONT_COLOR, WIDTH//2, HEIGHT//2 + 10)
-            draw_text(screen, f"High Score: {high_score}", font, FONT_COLOR, WIDTH//2, HEIGHT//2 + 50)
-            draw_text(screen, "Press R to Restart or Q to Quit", font, FONT_COLOR, WIDTH//2, HEIGHT//2 + 90)
-
-        # *** Creator credit at bottom-left ***
-            draw_text(screen, "Created by Hülya Ceren Lüleci", font, (180, 180, 180), 10, HEIGHT - 30, center=False)
-
-        pygame.display.flip()  # Update the full display surface to the screen
-        clock.tick(FPS)        # Control the game frame rate
+            if event.type == pygame.QUIT:  # User clicks close button
+                self.quit()
+            elif event.type == pygame.VIDEORESIZE:
+                # Fit the game into the new window size and redraw everything
+                self.window.layout()
+                self.renderer.invalidate()
+            self.scene.handle_event(event)
+        self.profiler.lap("events")
+
+        self.scene.update()
+
+        # Restore the background under everything drawn last frame, then draw the scene
+        self.renderer.begin()
+        self.renderer.add(self.scene.draw(self.screen))
+
+        # Profiler overlay in the bottom-right corner (only when profiling)
+        self.renderer.add(self.profiler.draw_overlay(self.screen, self.overlay_font, WIDTH - 190, HEIGHT - 170))
+
+        self.renderer.present()     # Push the changed areas (or the full screen) to the display
+        if self.first_frame_ms is None:
+            self.first_frame_ms = (time.perf_counter() - self.started_at) * 1000
+            if self.profiler.enabled:
+                print(f"Startup: first frame after {self.first_frame_ms:.0f} ms")
+        self.profiler.lap("present")
+        # Control the frame rate (menus use a lower one to save CPU)
+        fps = self.fps
+        if self.scene.idle and not self.uncapped:
+            fps = min(fps, IDLE_FPS) if fps else IDLE_FPS
+        self.clock.tick(fps)
+        self.profiler.lap("tick")
+        self.profiler.end_frame(len(self.game.foods))
+
+    def run(self):
+        # Main loop: runs until the window is closed or Q is pressed
+        while True:
+            self.run_frame()
+
+
+def main(replay_path=None, uncapped=False):
+    # Frame profiler is off unless SNACKLOTL_PROFILE or --profile is given
+    frame_profiler = profiler.from_environment(sys.argv[1:])
+
+    # Replay recording is off unless SNACKLOTL_RECORD or --record=PATH is given
+    record_path = os.environ.get("SNACKLOTL_RECORD") or None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--record="):
+            record_path = arg.split("=", 1)[1]
+
+    App(frame_profiler, record_path=record_path, replay_path=replay_path, uncapped=uncapped).run()
 
 # Standard Python idiom to call main function if this file is run directly
 if __name__ == "__main__":
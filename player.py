@@ -1,35 +1,45 @@
-import pygame
-import os
+import assets
 
 class Player:
-    def __init__(self, x, y, size, assets_path):
+    # Fixed attribute slots: smaller objects and no per-instance __dict__
+    __slots__ = ("x", "y", "size", "assets_path", "screen_width", "frames", "current_frame", "animation_triggered",
+                 "animation_counter", "animation_speed", "rect")
+
+    def __init__(self, x, y, size, assets_path, screen_width=800):
         self.x = x
         self.y = y
         self.size = size
         self.assets_path = assets_path
+        self.screen_width = screen_width  # Logical screen width the player has to stay inside
 
         # Load animation frames (4 pieces)
         self.frames = []
         for i in range(1, 5):
-            image = pygame.image.load(os.path.join(assets_path, f"axolotl_{i}.png")).convert_alpha()
-            image = pygame.transform.scale(image, (size, size))
-            self.frames.append(image)
+            self.frames.append(assets.get_image(assets_path, f"axolotl_{i}.png", (size, size)))
 
         self.current_frame = 0
         self.animation_triggered = False
         self.animation_counter = 0
-        self.animation_speed = 10  # How many game frames does it take to change an animation frame?
+        self.animation_speed = 10  # How many game ticks does it take to change an animation frame?
+
+        self.rect = self.frames[0].get_rect(center=(self.x, self.y))
 
+    def reset(self, x):
+        """Puts the player back at x in its idle pose (used when restarting)."""
+        self.x = x
+        self.current_frame = 0
+        self.animation_triggered = False
+        self.animation_counter = 0
         self.rect = self.frames[0].get_rect(center=(self.x, self.y))
 
     def move(self, dx):
         self.x += dx
 
-        # Preserve screen borders (example: WIDTH=800)
+        # Preserve screen borders
         if self.x < self.size // 2:
             self.x = self.size // 2
-        elif self.x > 800 - self.size // 2:
-            self.x = 800 - self.size // 2
+        elif self.x > self.screen_width - self.size // 2:
+            self.x = self.screen_width - self.size // 2
 
         self.rect.center = (self.x, self.y)
 
@@ -47,8 +57,13 @@ class Player:
 
         self.rect = self.frames[self.current_frame].get_rect(center=(self.x, self.y))
 
+    def place(self, x):
+        """Puts the sprite at x for drawing (e.g. between two simulated positions)."""
+        self.x = x
+        self.rect = self.frames[self.current_frame].get_rect(center=(self.x, self.y))
+
     def draw(self, screen):
-        screen.blit(self.frames[self.current_frame], self.rect)
+        return screen.blit(self.frames[self.current_frame], self.rect)
 
     def trigger_animation(self):
         self.animation_triggered = True
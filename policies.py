@@ -0,0 +1,70 @@
+import random
+
+from logic import INPUT_LEFT, INPUT_RIGHT
+
+# -------------------------
+# --- SCRIPTED PLAYERS ---
+# -------------------------
+#
+# A policy is called once per tick with the logic.Game and returns the input
+# bitmask to hold for that tick. These are used by the batch runner and the
+# soak test to play headless games. They read game.foods as Food objects, so
+# the game must use the default "list" food store.
+
+
+def idle(game):
+    """Never moves."""
+    return 0
+
+
+class RandomPolicy:
+    """Holds a random direction (or nothing) for a random number of ticks."""
+
+    def __init__(self, seed=None, min_hold=5, max_hold=40):
+        self.rng = random.Random(seed)
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self.mask = 0
+        self.hold = 0
+
+    def __call__(self, game):
+        if self.hold <= 0:
+            self.mask = self.rng.choice([0, INPUT_LEFT, INPUT_RIGHT])
+            self.hold = self.rng.randint(self.min_hold, self.max_hold)
+        self.hold -= 1
+        return self.mask
+
+
+def chase(game):
+    """
+    Moves under the lowest snack and steps away from a toxin that is about to land.
+
+    A simple stand-in for a decent human player.
+    """
+    target = None
+    danger = None
+    for food in game.foods:
+        if food.type == 'toxin':
+            # Only toxins in the player's column and close to the bottom matter
+            if abs(food.x - game.player_x) < game.player_rect.width and food.y > game.height / 2:
+                if danger is None or food.y > danger.y:
+                    danger = food
+        elif target is None or food.y > target.y:
+            target = food
+
+    if danger is not None:
+        return INPUT_RIGHT if danger.x <= game.player_x else INPUT_LEFT
+    if target is not None and abs(target.x - game.player_x) > 5:
+        return INPUT_RIGHT if target.x > game.player_x else INPUT_LEFT
+    return 0
+
+
+def make_policy(name, seed=None):
+    """Returns a policy by name: "idle", "random" or "chase"."""
+    if name == "idle":
+        return idle
+    if name == "random":
+        return RandomPolicy(seed)
+    if name == "chase":
+        return chase
+    raise ValueError(f"Unknown policy: {name}")
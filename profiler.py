@@ -0,0 +1,171 @@
+import atexit
+import csv
+import json
+import os
+import time
+from collections import deque
+
+import assets
+import text_cache
+
+# -------------------------
+# --- FRAME PROFILER ---
+# -------------------------
+#
+# Opt-in timing of each phase of the game loop. Turn it on with the
+# SNACKLOTL_PROFILE environment variable or the --profile flag:
+#
+#   SNACKLOTL_PROFILE=1 python main.py              -> writes profile.csv on exit
+#   python main.py --profile=trace.json             -> Chrome trace (open in chrome://tracing)
+#
+# Each frame is split into phases by calling lap(name) at the end of the phase.
+# When profiling is off every call returns immediately.
+
+OVERLAY_COLOR = (255, 255, 0)
+OVERLAY_REFRESH = 0.5   # Seconds between overlay text updates
+
+# The overlay renders its own text: its lines change every refresh, so they
+# would only push the game's text out of the text cache
+counters = {"overlay_surfaces": 0}
+
+
+def surfaces_created():
+    """Total number of surfaces made so far by the image and text caches and the overlay."""
+    cache = text_cache.cache
+    return assets.counters["surfaces"] + cache.misses + counters["overlay_surfaces"]
+
+
+class FrameProfiler:
+    def __init__(self, enabled=False, output_path=None, max_frames=100000):
+        self.enabled = enabled
+        self.output_path = output_path
+        self.frames = deque(maxlen=max_frames)  # Recorded frames (oldest dropped first)
+        self.phase_names = []                   # Phase names in the order they were first seen
+        self.frame_start = 0.0
+        self.last_lap = 0.0
+        self.phases = {}
+        self.slices = []    # (name, start, duration) of every lap this frame, in the order they ran
+        self.surfaces_at_start = 0
+        self.overlay_lines = []
+        self.overlay_time = 0.0
+        if enabled and output_path:
+            atexit.register(self.export)
+
+    def start_frame(self):
+        """Marks the start of a new frame."""
+        if not self.enabled:
+            return
+        self.frame_start = self.last_lap = time.perf_counter()
+        self.phases = {}
+        self.slices = []
+        self.surfaces_at_start = surfaces_created()
+
+    def lap(self, name):
+        """Ends the current phase and records how long it took."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases[name] = self.phases.get(name, 0.0) + (now - self.last_lap)
+        self.slices.append((name, self.last_lap, now - self.last_lap))
+        self.last_lap = now
+        if name not in self.phase_names:
+            self.phase_names.append(name)
+
+    def end_frame(self, items_alive=0):
+        """Stores the finished frame together with the number of live items."""
+        if not self.enabled:
+            return
+        self.frames.append({
+            "start": self.frame_start,
+            "total": self.last_lap - self.frame_start,
+            "phases": self.phases,
+            "slices": self.slices,
+            "items": items_alive,
+            "surfaces": surfaces_created() - self.surfaces_at_start,
+        })
+
+    def summary(self, last=60):
+        """Average milliseconds per phase over the last `last` frames."""
+        frames = list(self.frames)[-last:]
+        if not frames:
+            return {}
+        result = {}
+        for name in self.phase_names:
+            result[name] = 1000 * sum(f["phases"].get(name, 0.0) for f in frames) / len(frames)
+        result["total"] = 1000 * sum(f["total"] for f in frames) / len(frames)
+        return result
+
+    def draw_overlay(self, screen, font, x, y):
+        """
+        Draws the per-phase averages in the corner of the screen.
+
+        The text is refreshed twice a second, so it is readable and does not
+        add a new text surface every frame. Returns the list of drawn rects.
+        """
+        if not self.enabled:
+            return []
+        now = time.perf_counter()
+        if now - self.overlay_time > OVERLAY_REFRESH and self.frames:
+            self.overlay_time = now
+            last = self.frames[-1]
+            lines = [f"{name}: {ms:.2f} ms" for name, ms in self.summary().items()]
+            lines.append(f"items: {last['items']}  surfaces: {last['surfaces']}")
+            self.overlay_lines = [font.render(line, True, OVERLAY_COLOR) for line in lines]
+            counters["overlay_surfaces"] += len(self.overlay_lines)
+        rects = []
+        for i, surface in enumerate(self.overlay_lines):
+            rects.append(screen.blit(surface, (x, y + i * surface.get_height())))
+        return rects
+
+    def export(self, path=None):
+        """Writes the recorded frames as CSV, or as Chrome trace JSON for a .json path."""
+        path = path or self.output_path
+        if not path or not self.frames:
+            return
+        if path.endswith(".json"):
+            self._export_trace(path)
+        else:
+            self._export_csv(path)
+
+    def _export_csv(self, path):
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "total_ms"] + [f"{name}_ms" for name in self.phase_names] +
+                            ["items", "surfaces"])
+            for i, frame in enumerate(self.frames):
+                writer.writerow([i, round(1000 * frame["total"], 4)] +
+                                [round(1000 * frame["phases"].get(name, 0.0), 4) for name in self.phase_names] +
+                                [frame["items"], frame["surfaces"]])
+
+    def _export_trace(self, path):
+        events = []
+        origin = self.frames[0]["start"]
+        for frame in self.frames:
+            ts = (frame["start"] - origin) * 1e6  # Chrome traces use microseconds
+            events.append({"name": "frame", "ph": "X", "ts": ts, "dur": frame["total"] * 1e6,
+                           "pid": 1, "tid": 1})
+            # Each lap at the time it really ran (a phase can run several times in one frame)
+            for name, start, duration in frame["slices"]:
+                events.append({"name": name, "ph": "X", "ts": (start - origin) * 1e6, "dur": duration * 1e6,
+                               "pid": 1, "tid": 2})
+            events.append({"name": "counters", "ph": "C", "ts": (frame["start"] - origin) * 1e6, "pid": 1,
+                           "args": {"items": frame["items"], "surfaces": frame["surfaces"]}})
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+
+def from_environment(argv=()):
+    """
+    Builds a profiler from SNACKLOTL_PROFILE or a --profile[=PATH] argument.
+
+    A value of "1" writes profile.csv; any other value is used as the output path.
+    """
+    value = os.environ.get("SNACKLOTL_PROFILE", "")
+    for arg in argv:
+        if arg == "--profile":
+            value = "1"
+        elif arg.startswith("--profile="):
+            value = arg.split("=", 1)[1]
+    if not value or value == "0":
+        return FrameProfiler(enabled=False)
+    return FrameProfiler(enabled=True, output_path="profile.csv" if value == "1" else value)
@@ -0,0 +1,194 @@
+import pygame
+
+# -------------------------
+# --- SCREEN RENDERERS ---
+# -------------------------
+#
+# Both renderers are used the same way every frame:
+#   renderer.begin()         -> clear the screen for a new frame
+#   renderer.add(rects)      -> report the areas that were drawn on
+#   renderer.present()       -> show the frame
+#
+# FullRenderer redraws the whole background and flips the whole display.
+# DirtyRenderer only restores the background under what was drawn last frame
+# and only pushes the changed areas to the display, which is much cheaper
+# when just the items, the axolotl and the HUD move.
+#
+# Both hand the finished frame to an output with flip() and update(rects):
+# the pygame.display module itself, or a Window (below) that scales the
+# frame to the real window size.
+
+
+class FullRenderer:
+    def __init__(self, screen, background, output=pygame.display):
+        self.screen = screen
+        self.background = background
+        self.output = output
+
+    def begin(self):
+        """Draws the full background."""
+        self.screen.blit(self.background, (0, 0))
+
+    def add(self, rects):
+        """Full redraws do not need to know what changed."""
+
+    def invalidate(self):
+        """Every frame is already a full redraw."""
+
+    def present(self):
+        """Updates the full display surface."""
+        self.output.flip()
+
+
+class DirtyRenderer:
+    def __init__(self, screen, background, output=pygame.display):
+        self.screen = screen
+        self.background = background
+        self.output = output
+        self.screen_rect = screen.get_rect()
+        self.previous = []      # Areas drawn on during the last frame
+        self.current = []       # Areas drawn on during this frame
+        self.full_redraw = True  # The first frame always updates the whole display
+
+    def begin(self):
+        """Restores the background under everything drawn in the last frame."""
+        self.current = []
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            return
+        for rect in self.previous:
+            self.screen.blit(self.background, rect, rect)
+
+    def add(self, rects):
+        """Records areas that were drawn on this frame (None entries are skipped)."""
+        for rect in rects:
+            if rect is None:
+                continue
+            rect = self.screen_rect.clip(rect)
+            if rect.width and rect.height:
+                self.current.append(rect)
+
+    def invalidate(self):
+        """Forces the next frame to redraw and update the whole screen."""
+        self.full_redraw = True
+
+    def present(self):
+        """Pushes only the areas that changed since the last frame to the display."""
+        if self.full_redraw:
+            self.output.flip()
+            self.full_redraw = False
+        else:
+            # Old areas must be updated too, so the restored background shows up
+            self.output.update(self.previous + self.current)
+        self.previous = self.current
+
+
+def make_renderer(mode, screen, background, output=pygame.display):
+    """Returns the renderer for a mode name: "dirty" or "full"."""
+    if mode == "dirty":
+        return DirtyRenderer(screen, background, output)
+    if mode == "full":
+        return FullRenderer(screen, background, output)
+    raise ValueError(f"Unknown render mode: {mode}")
+
+
+# -------------------------
+# --- WINDOW SCALING ---
+# -------------------------
+#
+# The game is always drawn at its logical size (800x600) and the Window
+# shows that frame at any window or fullscreen size. The frame is scaled
+# once per frame, straight into the part of the display it covers; the
+# rest of the display is black bars (letterboxing). Sprites are never
+# scaled one by one.
+#
+#   same size as the game  -> scenes draw on the display itself, no copy at all
+#   whole-number scale     -> only the areas that changed are scaled (2x, 3x...)
+#   any other scale        -> the whole frame is scaled, the changed areas are shown
+#
+# The scaled frame is written into a subsurface of the display that is made
+# once per window size, so presenting a frame allocates no new surfaces.
+
+class Window:
+    """
+    The game window. Scenes draw on `surface`, which always has the logical size.
+
+    Parameters:
+    - logical_size: (width, height) the game is drawn at
+    - size: (width, height) of a resizable window, "fullscreen", or None for
+      a fixed window of the logical size
+    - integer: only scale by whole numbers (sharper pixels, wider black bars)
+    """
+
+    def __init__(self, logical_size, size=None, integer=False):
+        self.logical_size = logical_size
+        self.integer = integer
+        if size is None:
+            # Nothing to scale: the scenes draw straight on the display
+            self.display = pygame.display.set_mode(logical_size)
+            self.surface = self.display
+        else:
+            if size == "fullscreen":
+                self.display = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            else:
+                self.display = pygame.display.set_mode(size, pygame.RESIZABLE)
+            # The logical frame, in the display's pixel format so scaling is a plain copy
+            self.surface = pygame.Surface(logical_size, 0, self.display)
+        self.layout()
+
+    def layout(self):
+        """Works out where the frame goes in the window. Call again after the window is resized."""
+        if self.surface is not self.display:
+            self.display = pygame.display.get_surface()
+        width, height = self.logical_size
+        window_width, window_height = self.display.get_size()
+        scale = min(window_width / width, window_height / height)
+        if self.integer and scale >= 1:
+            scale = int(scale)
+        self.scale = scale
+        self.whole = scale == int(scale)  # Whole-number scale: pixels map exactly, areas can be scaled alone
+
+        self.frame_rect = pygame.Rect(0, 0, max(1, round(width * scale)), max(1, round(height * scale)))
+        self.frame_rect.center = self.display.get_rect().center
+        if self.surface is not self.display:
+            self.display.fill((0, 0, 0))  # The black bars around the frame
+            self.target = self.display.subsurface(self.frame_rect)
+
+    def to_window(self, rect):
+        """The window area that shows an area of the logical frame."""
+        scale = self.scale
+        if self.whole:
+            window_rect = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+        else:
+            # Rounding can move an edge by a pixel, so take one more pixel on each side
+            window_rect = pygame.Rect(int(rect.x * scale) - 1, int(rect.y * scale) - 1,
+                                      int(rect.width * scale) + 3, int(rect.height * scale) + 3)
+        return window_rect.move(self.frame_rect.topleft).clip(self.frame_rect)
+
+    def flip(self):
+        """Shows the whole frame."""
+        if self.surface is not self.display:
+            if self.scale == 1:
+                self.target.blit(self.surface, (0, 0))
+            else:
+                pygame.transform.scale(self.surface, self.frame_rect.size, self.target)
+        pygame.display.flip()
+
+    def update(self, rects):
+        """Shows the parts of the frame inside `rects` (logical coordinates)."""
+        if self.surface is self.display:
+            pygame.display.update(rects)
+            return
+
+        if not self.whole:
+            # Scaled areas would not line up exactly, so scale the whole frame
+            pygame.transform.scale(self.surface, self.frame_rect.size, self.target)
+        else:
+            scale = int(self.scale)
+            for rect in rects:
+                area = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+                if scale == 1:
+                    self.target.blit(self.surface, area, rect)
+                else:
+                    pygame.transform.scale(self.surface.subsurface(rect), area.size, self.target.subsurface(area))
+        pygame.display.update([self.to_window(rect) for rect in rects])
@@ -0,0 +1,198 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+import time
+import zlib
+
+import logic
+
+# -------------------------
+# --- REPLAY FILES ---
+# -------------------------
+#
+# A game is fully decided by its seed and the keys held on each tick, so a
+# replay stores only those. File layout (little-endian):
+#
+#   header   magic "SLRP", version, seed, tick count, final score,
+#            spawn checksum, length of the settings JSON
+#   settings JSON with the screen size, food types and logic.Rules values
+#   inputs   the input bitmask of every tick, 2 bits each, 4 ticks per byte
+#
+# One hour of play is about 54 KB. The tick count, score and checksum are
+# filled in when the game ends; playing the file back must reproduce them.
+# Playback memory-maps the file, so even multi-hour replays are not read
+# into memory.
+#
+#   python replay.py game.slr              -> headless, as fast as possible
+#   python replay.py game.slr --window     -> watch it in the game window
+
+MAGIC = b"SLRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHqqqIxxI")   # magic, version, seed, ticks, score, checksum, settings length
+TICKS_PER_BYTE = 4
+
+
+class SpawnChecksum:
+    """Running CRC-32 of the type and position of every item spawned in a game."""
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, game):
+        if logic.EVENT_SPAWN in game.events:
+            food_type, x = game.last_spawn
+            self.value = zlib.crc32(f"{game.tick}:{food_type}:{x};".encode(), self.value)
+
+
+class ReplayWriter:
+    """Records one game: call record() after every Game.step() and close() at the end."""
+
+    def __init__(self, path, game):
+        self.path = path
+        self.game = game
+        self.checksum = SpawnChecksum()
+        self.ticks = 0
+        self.byte = 0
+        settings = json.dumps({
+            "width": game.width,
+            "height": game.height,
+            "food_types": game.food_types,
+            "rules": game.rules.as_dict(),
+        }).encode()
+        self.settings_length = len(settings)
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, game.seed, 0, 0, 0, self.settings_length))
+        self.file.write(settings)
+
+    def record(self, input_bitmask):
+        """Stores the input of the tick that was just played."""
+        self.checksum.update(self.game)
+        shift = 2 * (self.ticks % TICKS_PER_BYTE)
+        self.byte |= (input_bitmask & 3) << shift
+        self.ticks += 1
+        if self.ticks % TICKS_PER_BYTE == 0:
+            self.file.write(bytes((self.byte,)))
+            self.byte = 0
+
+    def close(self):
+        """Writes the last inputs and the final tick count, score and checksum."""
+        if self.file.closed:
+            return
+        if self.ticks % TICKS_PER_BYTE:
+            self.file.write(bytes((self.byte,)))
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.game.seed, self.ticks, self.game.score,
+                                    self.checksum.value, self.settings_length))
+        self.file.close()
+
+
+class ReplayReader:
+    """Reads a replay file through a memory map."""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = None
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)  # ValueError if empty
+            (magic, version, self.seed, self.ticks, self.final_score, self.checksum,
+             settings_length) = HEADER.unpack_from(self.map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("wrong magic or version")
+            settings = json.loads(self.map[HEADER.size:HEADER.size + settings_length])
+            self.width = settings["width"]
+            self.height = settings["height"]
+            self.food_types = settings["food_types"]
+            self.rules = logic.Rules(**settings["rules"])
+        except (ValueError, TypeError, KeyError, struct.error):
+            # Empty, cut short, or some other kind of file
+            self.close()
+            raise ValueError(f"{path} is not a SnackLotl replay (version {VERSION})") from None
+        self.inputs_offset = HEADER.size + settings_length
+
+    def make_game(self, **kwargs):
+        """Creates a logic.Game set up exactly like the recorded one."""
+        return logic.Game(self.width, self.height, seed=self.seed, food_types=self.food_types,
+                          rules=self.rules, **kwargs)
+
+    def inputs(self, chunk_size=1 << 16):
+        """Yields the input bitmask of every tick, reading the map in chunks."""
+        remaining = self.ticks
+        offset = self.inputs_offset
+        while remaining > 0:
+            chunk = self.map[offset:offset + chunk_size]
+            offset += chunk_size
+            for byte in chunk:
+                for shift in (0, 2, 4, 6):
+                    if remaining == 0:
+                        return
+                    yield (byte >> shift) & 3
+                    remaining -= 1
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+
+def numbered_path(path, number):
+    """game.slr, 0 -> game.slr; game.slr, 2 -> game-2.slr (one file per game of a session)."""
+    if number == 0:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}-{number}{ext}"
+
+
+def play_headless(path, store="list"):
+    """
+    Replays a file without a window, as fast as the CPU allows.
+
+    Returns (game, matches, seconds): matches is True when the score and the
+    spawn checksum equal the recorded ones.
+    """
+    reader = ReplayReader(path)
+    try:
+        game = reader.make_game(store=store)
+        checksum = SpawnChecksum()
+        start = time.perf_counter()
+        for input_bitmask in reader.inputs():
+            game.step(input_bitmask)
+            checksum.update(game)
+        seconds = time.perf_counter() - start
+        matches = game.score == reader.final_score and checksum.value == reader.checksum
+        return game, matches, seconds
+    finally:
+        reader.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play back a SnackLotl replay")
+    parser.add_argument("path")
+    parser.add_argument("--window", action="store_true", help="show the replay in the game window")
+    parser.add_argument("--fast", action="store_true", help="with --window: do not limit the frame rate")
+    args = parser.parse_args(argv)
+
+    try:
+        ReplayReader(args.path).close()  # Check the file before a window opens
+    except (OSError, ValueError) as error:
+        print("Cannot play the replay:", error)
+        return 2
+
+    if args.window:
+        import main as game_main
+        game_main.main(replay_path=args.path, uncapped=args.fast)
+        return 0
+
+    game, matches, seconds = play_headless(args.path)
+    print(f"{game.tick} ticks in {seconds:.3f} s ({game.tick / max(seconds, 1e-9):,.0f} ticks/s), "
+          f"score {game.score}, {'matches the recording' if matches else 'DOES NOT match the recording'}")
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+import math
+import os
+import time
+from array import array
+
+import pygame
+
+from logic import EVENT_CATCH, EVENT_TOXIN, EVENT_LIFE_LOST, EVENT_SPEED_UP, EVENT_GAME_OVER
+
+# -------------------------
+# --- SOUND EFFECTS ---
+# -------------------------
+#
+# Every effect is decoded once, at startup, into a pygame Sound held in
+# memory. Nothing is read from disk while the game runs.
+#
+# Effects play on a fixed pool of mixer channels reserved for them, so
+# pygame never has to search all its channels for a free one.
+# When every channel is busy the new effect takes over ("steals") the
+# channel of the oldest effect of the same or lower priority. If all of them
+# are more important, the new effect is dropped. Both cases are counted.
+#
+# An effect can be replaced by dropping a file named sfx_<name>.wav or
+# sfx_<name>.ogg into assets/. Otherwise a short tone is synthesized.
+
+FREQUENCY = 44100
+BUFFER = 512            # Mixer buffer in samples: about 12 ms from play() to the speakers
+CHANNELS = 8            # Mixer channels reserved for effects
+VOLUME = 0.5
+
+# name: (priority, tone segments as (start Hz, end Hz, seconds))
+EFFECTS = {
+    "catch": (0, [(660, 990, 0.08)]),
+    "speed_up": (1, [(523, 523, 0.08), (784, 784, 0.1)]),
+    "toxin": (2, [(180, 120, 0.15)]),
+    "life_lost": (2, [(440, 220, 0.3)]),
+    "game_over": (3, [(392, 392, 0.18), (330, 330, 0.18), (262, 220, 0.35)]),
+}
+
+# The effect played for each event reported by logic.Game
+EVENT_EFFECTS = {
+    EVENT_CATCH: "catch",
+    EVENT_SPEED_UP: "speed_up",
+    EVENT_TOXIN: "toxin",
+    EVENT_LIFE_LOST: "life_lost",
+    EVENT_GAME_OVER: "game_over",
+}
+
+
+def pre_init():
+    """Asks for a small mixer buffer. Must be called before pygame.init()."""
+    pygame.mixer.pre_init(FREQUENCY, -16, 2, BUFFER)
+
+
+def synthesize(segments):
+    """
+    Makes a tone as raw signed 16-bit samples in the mixer's format.
+
+    Parameters:
+    - segments: list of (start Hz, end Hz, seconds) played one after another
+    """
+    frequency, _, channels = pygame.mixer.get_init()
+    samples = array("h")
+    phase = 0.0
+    for start_hz, end_hz, seconds in segments:
+        count = int(frequency * seconds)
+        for i in range(count):
+            t = i / count
+            phase += 2 * math.pi * (start_hz + (end_hz - start_hz) * t) / frequency
+            envelope = min(1.0, i / 200) * (1 - t)   # Short fade in, linear fade out (no clicks)
+            value = int(12000 * envelope * math.sin(phase))
+            samples.extend([value] * channels)
+    return pygame.mixer.Sound(buffer=samples.tobytes())
+
+
+class Sfx:
+    """
+    The game's sound effects and the channels they play on.
+
+    Parameters:
+    - assets_path: folder searched for sfx_<name>.wav / .ogg replacements
+    - channels: how many mixer channels to reserve for effects
+    """
+
+    def __init__(self, assets_path, channels=CHANNELS):
+        self.assets_path = assets_path
+        self.sounds = {}         # name -> Sound, filled by load()
+        self.channels = []
+        self.playing = []        # (priority, start time) of what each channel was last given
+        self.enabled = False
+
+        # Statistics
+        self.plays = 0
+        self.stolen = 0          # Effects cut off to make room for a new one
+        self.dropped = 0         # Effects not played because every channel had something more important
+        self.play_seconds = 0.0  # Time spent inside play(), to show it never holds up a frame
+        self.play_seconds_max = 0.0
+
+        if not pygame.mixer.get_init():
+            print("Sound effects disabled: no audio device")
+            return
+        if pygame.mixer.get_num_channels() < channels + 1:
+            pygame.mixer.set_num_channels(channels + 1)
+        pygame.mixer.set_reserved(channels)  # find_channel() and Sound.play() leave these alone
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.playing = [(-1, 0.0)] * channels
+        self.enabled = True
+
+    def load(self):
+        """Decodes or synthesizes every effect. Safe to run on the loader thread."""
+        if not self.enabled:
+            return
+        for name, (priority, segments) in EFFECTS.items():
+            sound = None
+            for extension in (".wav", ".ogg"):
+                path = os.path.join(self.assets_path, f"sfx_{name}{extension}")
+                if os.path.exists(path):
+                    try:
+                        sound = pygame.mixer.Sound(path)
+                    except pygame.error as error:
+                        print("Could not load", path, "-", error)
+                    break
+            if sound is None:
+                if pygame.mixer.get_init()[1] != -16:
+                    print("Sound effect", name, "skipped: the mixer is not in 16-bit mode")
+                    continue
+                sound = synthesize(segments)
+            sound.set_volume(VOLUME)
+            self.sounds[name] = sound
+
+    @property
+    def latency_ms(self):
+        """Time from play() to the sound reaching the speakers, set by the mixer buffer."""
+        if not self.enabled:
+            return 0.0
+        frequency = pygame.mixer.get_init()[0]
+        return BUFFER / frequency * 1000
+
+    def play(self, name):
+        """Starts an effect on a free channel, stealing or dropping if none is free."""
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        started = time.perf_counter()
+        priority = EFFECTS[name][0]
+
+        # A free channel, or else the oldest effect that matters no more than this one
+        chosen = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                chosen = i
+                break
+            if self.playing[i][0] <= priority and (chosen is None or self.playing[i] < self.playing[chosen]):
+                chosen = i
+
+        if chosen is None:
+            self.dropped += 1
+        else:
+            if self.channels[chosen].get_busy():
+                self.stolen += 1
+            self.channels[chosen].play(sound)   # Replaces whatever the channel was playing
+            self.playing[chosen] = (priority, started)
+            self.plays += 1
+
+        elapsed = time.perf_counter() - started
+        self.play_seconds += elapsed
+        self.play_seconds_max = max(self.play_seconds_max, elapsed)
+
+    def play_events(self, events):
+        """Plays the effect of every event from one Game.step()."""
+        for event in events:
+            name = EVENT_EFFECTS.get(event)
+            if name:
+                self.play(name)
+
+    def summary(self):
+        """One line of statistics for the console."""
+        calls = self.plays + self.dropped
+        mean_us = self.play_seconds / calls * 1e6 if calls else 0.0
+        return (f"Sound effects: {self.plays} played, {self.stolen} stolen, {self.dropped} dropped; "
+                f"play() mean {mean_us:.0f} us, max {self.play_seconds_max * 1e6:.0f} us; "
+                f"mixer latency {self.latency_ms:.1f} ms")
@@ -0,0 +1,217 @@
+import os
+
+# Run without a window or sound card: must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pygame
+
+import assets
+import main as game_main
+import profiler
+import text_cache
+from food import Food
+from policies import make_policy
+
+# -------------------------
+# --- SOAK TEST ---
+# -------------------------
+#
+# Plays the real game (App, scenes, renderer, HUD, sounds) headless for
+# millions of ticks: a scripted player plays until game over, the game
+# restarts, and so on. Every --sample-every ticks it records:
+#
+#   traced_bytes     Python memory still allocated (tracemalloc)
+#   rss_bytes        memory of the whole process, including pygame's surfaces
+#   food_objects     Food objects alive anywhere
+#   surfaces         pygame Surfaces alive anywhere (caches, sprites, screens)
+#   image_surfaces   decoded and scaled images held by the image cache
+#   text_surfaces    rendered text surfaces held by the text cache
+#   text_bytes       pixel memory of those surfaces
+#   text_renders     text surfaces rendered so far (draw_text cache misses)
+#
+# The first --warmup part of the run is ignored (caches fill up, the pools
+# reach their size). After that, memory may only grow by a small allowance
+# per million ticks and the object counts must stop growing; otherwise the
+# soak test fails with exit code 1. The text cache can take a long time to
+# fill (new scores and ranks keep adding lines until it is full), so its
+# pixel memory is taken out of the RSS before checking it; the cache itself
+# is checked against its size limit.
+#
+#   python soak.py --ticks 5000000 --out soak.json
+
+MAX_TRACED_GROWTH = 1_000_000    # Bytes per million ticks
+MAX_RSS_GROWTH = 8_000_000       # Bytes per million ticks (the allocator keeps some memory around)
+
+
+def rss_bytes():
+    """Resident memory of this process in bytes, or None where it cannot be read."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def live_surfaces():
+    """
+    Number of pygame Surfaces reachable from Python objects.
+
+    Surfaces hold no references to other objects, so the garbage collector does
+    not track them and gc.get_objects() never lists them. They are found among
+    the objects that tracked containers point to instead (looking inside tuples
+    too, as a tuple of untracked objects is not tracked either).
+    """
+    found = set()
+    for container in gc.get_objects():
+        pending = gc.get_referents(container)
+        while pending:
+            obj = pending.pop()
+            if isinstance(obj, pygame.Surface):
+                found.add(id(obj))
+            elif type(obj) is tuple and not gc.is_tracked(obj):
+                pending.extend(obj)
+    return len(found)
+
+
+def take_sample(app, ticks):
+    cached = assets.stats()
+    return {
+        "tick": ticks,
+        "games": app.restarts + 1,
+        "traced_bytes": tracemalloc.get_traced_memory()[0],
+        "rss_bytes": rss_bytes(),
+        "food_objects": sum(1 for obj in gc.get_objects() if isinstance(obj, Food)),
+        "surfaces": live_surfaces(),
+        "image_surfaces": cached["decoded"] + cached["scaled"],
+        "text_surfaces": len(text_cache.cache),
+        "text_bytes": sum(surface.get_width() * surface.get_height() * surface.get_bytesize()
+                          for surface in text_cache.cache.surfaces.values()),
+        "text_renders": text_cache.cache.misses,
+        "surfaces_created": profiler.surfaces_created(),
+    }
+
+
+def growth_per_million(samples, key):
+    """Least-squares slope of samples[key] over the tick count, per million ticks."""
+    points = [(s["tick"], s[key]) for s in samples if s[key] is not None]
+    if len(points) < 2:
+        return 0.0
+    mean_tick = sum(t for t, _ in points) / len(points)
+    mean_value = sum(v for _, v in points) / len(points)
+    spread = sum((t - mean_tick) ** 2 for t, _ in points)
+    if spread == 0:
+        return 0.0
+    slope = sum((t - mean_tick) * (v - mean_value) for t, v in points) / spread
+    return slope * 1_000_000
+
+
+def check(samples, warmup, max_traced_growth, max_rss_growth):
+    """Returns the list of problems found in the samples taken after the warm-up."""
+    steady = [s for s in samples if s["tick"] > warmup]
+    if len(steady) < 4:
+        return ["too few samples after the warm-up to judge; use more --ticks or a smaller --sample-every"]
+
+    for sample in steady:
+        rss = sample["rss_bytes"]
+        sample["rss_without_text"] = rss - sample["text_bytes"] if rss is not None else None
+        sample["surfaces_without_text"] = sample["surfaces"] - sample["text_surfaces"]
+
+    problems = []
+    for key, limit in (("traced_bytes", max_traced_growth), ("rss_without_text", max_rss_growth)):
+        growth = growth_per_million(steady, key)
+        if growth > limit:
+            problems.append(f"{key} grows by {growth / 1e6:.2f} MB per million ticks (limit {limit / 1e6:.2f} MB)")
+
+    # Pools and the image cache are full after the warm-up: their counts must stay flat,
+    # and so must the other live surfaces once the text cache's are taken out
+    half = len(steady) // 2
+    for key in ("food_objects", "surfaces_without_text", "image_surfaces"):
+        before = max(s[key] for s in steady[:half])
+        after = max(s[key] for s in steady[half:])
+        if after > before:
+            problems.append(f"{key} still growing: {before} -> {after}")
+
+    # The text cache may fill up at any time, but never past its size
+    largest = max(s["text_surfaces"] for s in samples)
+    if largest > text_cache.cache.max_size:
+        problems.append(f"text cache holds {largest} surfaces (limit {text_cache.cache.max_size})")
+    return problems
+
+
+def print_sample(sample):
+    rss = f"{sample['rss_bytes'] / 1e6:8.1f}" if sample["rss_bytes"] is not None else "     n/a"
+    print(f"{sample['tick']:>10} {sample['games']:>6} {sample['traced_bytes'] / 1e6:>9.2f} {rss} "
+          f"{sample['food_objects']:>6} {sample['surfaces']:>8} {sample['image_surfaces']:>7} "
+          f"{sample['text_surfaces']:>6} {sample['text_renders']:>8}", flush=True)
+
+
+def run(ticks, sample_every, policy_name, seed):
+    """Plays `ticks` ticks of restarting games and returns the samples."""
+    # Keep the soak test's scores off the real leaderboard
+    game_main.LEADERBOARD_FILE = os.path.join(tempfile.mkdtemp(prefix="snacklotl-soak-"), "leaderboard.log")
+    app = game_main.App(profiler.FrameProfiler(), uncapped=True, policy=make_policy(policy_name, seed))
+    app.loader.wait()
+    app.run_frame()      # Finishes loading on the title screen
+    app.start_game()
+
+    print(f"{'tick':>10} {'games':>6} {'traced MB':>9} {'RSS MB':>8} {'foods':>6} {'surfaces':>8} {'images':>7} "
+          f"{'texts':>6} {'renders':>8}")
+    samples = []
+    played = 0
+    while played < ticks:
+        if app.scene is app.scenes["game_over"]:
+            app.run_frame()   # Show the game over screen once, like a player would see it
+            app.restart()
+        app.run_frame()       # Uncapped: exactly one tick per frame
+        played += 1
+        if played % sample_every == 0:
+            samples.append(take_sample(app, played))
+            print_sample(samples[-1])
+    app.leaderboard.close()
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play SnackLotl headless for a long time and check memory")
+    parser.add_argument("--ticks", type=int, default=1_000_000, help="game ticks to play in total")
+    parser.add_argument("--sample-every", type=int, default=50_000, help="ticks between two samples")
+    parser.add_argument("--warmup", type=float, default=0.25, help="part of the run ignored by the checks")
+    parser.add_argument("--policy", default="random", choices=["idle", "random", "chase"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-traced-growth", type=int, default=MAX_TRACED_GROWTH,
+                        help="allowed Python memory growth in bytes per million ticks")
+    parser.add_argument("--max-rss-growth", type=int, default=MAX_RSS_GROWTH,
+                        help="allowed process memory growth in bytes per million ticks")
+    parser.add_argument("--out", help="also write every sample to this JSON file")
+    args = parser.parse_args(argv)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    samples = run(args.ticks, args.sample_every, args.policy, args.seed)
+    elapsed = time.perf_counter() - start
+
+    problems = check(samples, args.ticks * args.warmup, args.max_traced_growth, args.max_rss_growth)
+    print(f"{args.ticks} ticks in {elapsed:.0f} s ({args.ticks / elapsed:,.0f} ticks/s)")
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump({"ticks": args.ticks, "policy": args.policy, "seed": args.seed,
+                       "problems": problems, "samples": samples}, file, indent=2)
+    for problem in problems:
+        print("FAIL:", problem)
+    if not problems:
+        print("PASS: no unbounded memory growth")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+import os
+
+# Keep pygame's import banner out of the report (printed once per worker otherwise)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import itertools
+import json
+import math
+import statistics
+import sys
+import time
+from multiprocessing import Pool
+
+import logic
+from policies import make_policy
+
+# -------------------------
+# --- BATCH DIFFICULTY SWEEP ---
+# -------------------------
+#
+# Plays thousands of seeded, headless games on all CPU cores and reports the
+# score and survival-time distributions for every combination of rules:
+#
+#   python sweep.py --episodes 2000 --policy chase --start-speed 4,5,6 --lives 3,5
+#
+# Every list option takes comma-separated values; the sweep runs the full
+# cartesian product of them. Food weights are given per set as
+# shrimp:fish:toxin, e.g. --weights 1:1:1,2:2:1
+
+MAX_TICKS = logic.TICK_RATE * 60 * 30  # Stop an episode after 30 minutes of game time
+
+
+def run_episode(job):
+    """Plays one game. Runs inside a worker process."""
+    config_index, rules_dict, policy_name, seed, max_ticks = job
+    game = logic.Game(seed=seed, rules=logic.Rules(**rules_dict))
+    game.run(max_ticks, make_policy(policy_name, seed))
+    return config_index, game.score, game.tick, game.game_over
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list: the smallest value that
+    at least `fraction` of the values are less than or equal to.
+    """
+    if not sorted_values:
+        return 0
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        "mean": round(statistics.fmean(values), 3),
+        "p10": percentile(values, 0.1),
+        "median": percentile(values, 0.5),
+        "p90": percentile(values, 0.9),
+        "max": values[-1],
+    }
+
+
+def parse_list(text, convert):
+    return [convert(value) for value in text.split(",") if value]
+
+
+def parse_weights(text):
+    """'1:1:1,2:2:1' -> [[1.0, 1.0, 1.0], [2.0, 2.0, 1.0]] (an empty string means equal weights)."""
+    if not text:
+        return [None]
+    return [[float(w) for w in group.split(":")] for group in text.split(",")]
+
+
+def build_configs(args):
+    """Every combination of the swept rule values, as Rules keyword dicts. Raises ValueError on bad values."""
+    weight_sets = parse_weights(args.weights)
+    for weights in weight_sets:
+        if weights is None:
+            continue
+        if len(weights) != len(logic.FOOD_TYPES):
+            raise ValueError(f"--weights: each set needs {len(logic.FOOD_TYPES)} weights "
+                             f"({':'.join(logic.FOOD_TYPES)}), got {len(weights)}")
+        if min(weights) < 0 or sum(weights) <= 0:
+            raise ValueError("--weights: weights must not be negative and must not all be 0")
+
+    configs = []
+    for weights, spawn_ms, speed, step, lives, size in itertools.product(
+            weight_sets,
+            parse_list(args.spawn_ms, int),
+            parse_list(args.start_speed, float),
+            parse_list(args.speed_step, float),
+            parse_list(args.lives, int),
+            parse_list(args.player_size, int)):
+        configs.append(logic.Rules(food_weights=weights, spawn_interval_ms=spawn_ms, start_speed=speed,
+                                   speed_step=step, start_lives=lives, player_size=size).as_dict())
+    return configs
+
+
+def run_sweep(configs, episodes, policy_name, seed, workers, max_ticks):
+    """Runs `episodes` games per config on a process pool. Returns one report entry per config."""
+    jobs = [(i, config, policy_name, seed + episode, max_ticks)
+            for i, config in enumerate(configs) for episode in range(episodes)]
+    scores = [[] for _ in configs]
+    seconds = [[] for _ in configs]
+    unfinished = [0] * len(configs)
+
+    with Pool(workers) as pool:
+        for config_index, score, ticks, game_over in pool.imap_unordered(run_episode, jobs, chunksize=64):
+            scores[config_index].append(score)
+            seconds[config_index].append(ticks / logic.TICK_RATE)
+            if not game_over:
+                unfinished[config_index] += 1
+
+    return [{"rules": config,
+             "episodes": episodes,
+             "score": summarize(scores[i]),
+             "survival_seconds": summarize(seconds[i]),
+             "hit_tick_limit": unfinished[i]}
+            for i, config in enumerate(configs)]
+
+
+def print_report(report, out=sys.stdout):
+    print(f"{'spawn':>6} {'speed':>6} {'step':>5} {'lives':>5} {'size':>5} {'weights':>12} | "
+          f"{'score mean':>10} {'p10':>5} {'med':>5} {'p90':>5} | {'surv s med':>10} {'p90':>7}", file=out)
+    for entry in report:
+        rules = entry["rules"]
+        weights = ":".join(f"{w:g}" for w in rules["food_weights"]) if rules["food_weights"] else "equal"
+        score = entry["score"]
+        survival = entry["survival_seconds"]
+        print(f"{rules['spawn_interval_ms']:>6} {rules['start_speed']:>6g} {rules['speed_step']:>5g} "
+              f"{rules['start_lives']:>5} {rules['player_size']:>5} {weights:>12} | "
+              f"{score['mean']:>10} {score['p10']:>5} {score['median']:>5} {score['p90']:>5} | "
+              f"{survival['median']:>10.1f} {survival['p90']:>7.1f}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded headless SnackLotl games across all CPU cores")
+    parser.add_argument("--episodes", type=int, default=1000, help="games per rule combination")
+    parser.add_argument("--policy", default="random", choices=["idle", "random", "chase"])
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game; game n uses seed + n")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="tick limit per game")
+    parser.add_argument("--weights", default="", help="food weights shrimp:fish:toxin, comma-separated sets")
+    parser.add_argument("--spawn-ms", default=str(logic.SPAWN_INTERVAL_MS))
+    parser.add_argument("--start-speed", default=str(logic.START_SPEED))
+    parser.add_argument("--speed-step", default=str(logic.SPEED_STEP))
+    parser.add_argument("--lives", default=str(logic.START_LIVES))
+    parser.add_argument("--player-size", default=str(logic.PLAYER_SIZE))
+    parser.add_argument("--json", help="also write the full report to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        configs = build_configs(args)
+    except ValueError as error:
+        parser.error(str(error))   # Bad option values: stop here, not inside a worker
+    start = time.perf_counter()
+    report = run_sweep(configs, args.episodes, args.policy, args.seed, args.workers, args.max_ticks)
+    elapsed = time.perf_counter() - start
+
+    print_report(report)
+    print(f"{len(configs) * args.episodes} games on {args.workers} workers in {elapsed:.1f} s")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"policy": args.policy, "seed": args.seed, "results": report}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
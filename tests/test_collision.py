@@ -0,0 +1,41 @@
+import random
+
+import pygame
+
+from collision import SweepIndex, brute_force_hits, find_hits
+
+# The broad phase must report exactly the hits of the all-pairs loop
+
+
+def random_rects(rng, count, max_size):
+    return [pygame.Rect(rng.randint(-50, 850), rng.randint(-50, 650),
+                        rng.randint(1, max_size), rng.randint(1, max_size))
+            for _ in range(count)]
+
+
+def test_find_hits_matches_all_pairs():
+    rng = random.Random(9)
+    for _ in range(300):
+        items = random_rects(rng, rng.randint(0, 60), 80)
+        catchers = random_rects(rng, rng.randint(0, 4), 200)
+        assert find_hits(items, catchers) == brute_force_hits(items, catchers)
+
+
+def test_sweep_index_after_adds_and_removes():
+    rng = random.Random(3)
+    index = SweepIndex()
+    live = {}
+    for _ in range(2000):
+        if live and rng.random() < 0.4:
+            key = rng.choice(list(live))
+            index.remove(key)
+            del live[key]
+        else:
+            rect = random_rects(rng, 1, 60)[0]
+            live[index.add(rect)] = rect
+        for rect in live.values():
+            rect.y += 3    # Items fall without the index being told
+        catcher = random_rects(rng, 1, 200)[0]
+        expected = [rect for rect in live.values() if rect.colliderect(catcher)]
+        assert sorted(map(id, index.query(catcher))) == sorted(map(id, expected))
+    assert len(index) == len(live)
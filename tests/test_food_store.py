@@ -0,0 +1,25 @@
+import pytest
+
+import logic
+from policies import RandomPolicy
+
+# The NumPy food store must play exactly the same game as the list of Food objects
+
+pytest.importorskip("numpy")
+
+TICKS = 5000
+
+
+def state(game):
+    return (game.tick, game.score, game.lives, game.speed, game.player_x, game.game_over, len(game.foods))
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_array_store_matches_list_store(seed):
+    by_list = logic.Game(seed=seed, store="list")
+    by_array = logic.Game(seed=seed, store="array")
+    list_policy, array_policy = RandomPolicy(seed), RandomPolicy(seed)
+    while not by_list.game_over and by_list.tick < TICKS:
+        assert by_list.step(list_policy(by_list)) == by_array.step(array_policy(by_array))
+        assert state(by_list) == state(by_array)
+    assert by_array.game_over == by_list.game_over
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from leaderboard import Leaderboard, ScoreIndex
+
+# Ranks and the top 10 must survive compaction, crashes and damaged logs
+
+
+def expected_rank(scores, score):
+    return 1 + sum(other > score for other in scores)
+
+
+def play(board, count, seed):
+    rng = random.Random(seed)
+    scores = []
+    for _ in range(count):
+        score = rng.randint(0, 300)
+        scores.append(score)
+        assert board.record(score) == expected_rank(scores, score)
+    return scores
+
+
+def test_rank_and_top_ten(tmp_path):
+    board = Leaderboard(str(tmp_path / "board.log"), compact_every=10 ** 9)
+    scores = play(board, 500, 1)
+    board.close()
+    assert board.games == len(scores)
+    assert board.high_score() == max(scores)
+    assert [score for score, _ in board.top_scores(10)] == sorted(scores, reverse=True)[:10]
+    for score in range(0, 320, 7):
+        assert board.rank(score) == expected_rank(scores, score)
+
+
+def test_reload_after_compaction(tmp_path):
+    path = str(tmp_path / "board.log")
+    board = Leaderboard(path, compact_every=100)
+    scores = play(board, 350, 2)   # Compacts three times, then appends 50 more games
+    board.close()
+    reloaded = Leaderboard(path, compact_every=100)
+    reloaded.close()
+    assert reloaded.games == len(scores)
+    assert reloaded.top_scores(10) == board.top_scores(10)
+    assert all(reloaded.rank(score) == board.rank(score) for score in range(0, 320, 5))
+    assert reloaded.skipped_lines == 0
+
+
+def test_torn_and_corrupt_lines(tmp_path):
+    path = tmp_path / "board.log"
+    path.write_text("# SnackLotl leaderboard 1\n"
+                    "game 10 100\n"
+                    "game ten 100\n"   # Not a number
+                    "game -1 5\n"      # Negative score
+                    "count 4 -2\n"     # Negative count
+                    "score 3 100\n"    # Unknown kind
+                    "game 7 100\n"
+                    "game 12")         # Torn by a crash while appending
+    board = Leaderboard(str(path))
+    assert board.games == 2
+    assert board.skipped_lines == 4
+    assert board.torn_tail
+    board.record(20)
+    board.close()
+
+    # The torn line was finished, so the new game got a line of its own
+    reloaded = Leaderboard(str(path))
+    reloaded.close()
+    assert reloaded.games == 3
+    assert reloaded.top_scores() == [(20, reloaded.top_scores()[0][1]), (10, 100), (7, 100)]
+    assert not reloaded.torn_tail
+
+
+def test_negative_legacy_score_is_not_imported(tmp_path):
+    legacy = tmp_path / "highscore.txt"
+    legacy.write_text("-3")
+    board = Leaderboard(str(tmp_path / "board.log"), legacy_path=str(legacy))
+    board.close()
+    assert board.games == 0
+
+
+def test_score_index_rejects_negative_scores():
+    index = ScoreIndex()
+    with pytest.raises(ValueError):
+        index.add(-1)
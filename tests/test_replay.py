@@ -0,0 +1,52 @@
+import pytest
+
+import logic
+import replay
+from policies import RandomPolicy
+
+# A recorded game played back headless must end with the same score and spawns
+
+TICKS = 4000
+
+
+def record(path, seed, rules=None):
+    game = logic.Game(seed=seed, rules=rules)
+    writer = replay.ReplayWriter(str(path), game)
+    policy = RandomPolicy(seed)
+    while not game.game_over and game.tick < TICKS:
+        mask = policy(game)
+        game.step(mask)
+        writer.record(mask)
+    writer.close()
+    return game
+
+
+def test_replay_round_trip(tmp_path):
+    for seed in range(4):
+        path = tmp_path / f"game-{seed}.slr"
+        recorded = record(path, seed)
+        played, matches, _ = replay.play_headless(str(path))
+        assert matches
+        assert (played.score, played.lives, played.tick) == (recorded.score, recorded.lives, recorded.tick)
+
+
+def test_replay_keeps_the_rules(tmp_path):
+    path = tmp_path / "rules.slr"
+    rules = logic.Rules(food_weights=[1, 1, 3], start_speed=4)
+    recorded = record(path, 11, rules)
+    reader = replay.ReplayReader(str(path))
+    try:
+        assert reader.rules.as_dict() == rules.as_dict()
+        assert reader.ticks == recorded.tick
+    finally:
+        reader.close()
+    assert replay.play_headless(str(path), store="list")[1]
+
+
+@pytest.mark.parametrize("content", [b"", b"SL", b"not a replay at all, just some text " * 3])
+def test_damaged_files_are_not_replays(tmp_path, content):
+    path = tmp_path / "bad.slr"
+    path.write_bytes(content)
+    with pytest.raises(ValueError, match="not a SnackLotl replay"):
+        replay.ReplayReader(str(path))
+    assert replay.main([str(path)]) == 2
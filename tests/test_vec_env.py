@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+import logic
+
+# Every game in a VecEnv must follow logic.Game tick for tick
+
+np = pytest.importorskip("numpy")
+from vec_env import VecEnv  # noqa: E402 (needs numpy)
+
+NUM_ENVS = 8
+TICKS = 3000
+
+
+def test_vec_env_matches_logic_game():
+    env = VecEnv(NUM_ENVS, seed=100, autoreset=False)
+    env.reset()
+    games = [logic.Game(seed=100 + i) for i in range(NUM_ENVS)]
+    rng = random.Random(5)
+    for tick in range(TICKS):
+        actions = np.array([rng.choice([0, 1, 2, 3]) for _ in range(NUM_ENVS)])
+        env.step(actions)
+        for i, game in enumerate(games):
+            game.step(int(actions[i]))
+            assert (game.score, game.lives, game.tick, game.game_over, game.player_x) == \
+                (env.score[i], env.lives[i], env.tick[i], env.game_over[i], env.player_x[i]), (tick, i)
+            assert len(game.foods) == env.item_alive[i].sum()
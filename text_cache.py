@@ -0,0 +1,106 @@
+from collections import OrderedDict
+
+import pygame
+
+# -------------------------
+# --- TEXT SURFACE CACHE ---
+# -------------------------
+#
+# Rendering text with a font is one of the slowest things the game does each
+# frame. Most lines ("Press SPACE to START", "Lives: 3", ...) are the same from
+# one frame to the next, so the rendered surfaces are kept in a small
+# least-recently-used cache and only rendered again when the text changes.
+
+
+class TextCache:
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()  # (text, font, color, outline_color) -> surface
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def render(self, text, font, color, outline_color=None):
+        """
+        Returns a surface with the rendered text, rendering it only on a cache miss.
+
+        Parameters:
+        - text: the string to render
+        - font: the pygame font to render with
+        - color: RGB tuple for the text
+        - outline_color: RGB tuple for a 1-pixel outline, or None for plain text
+
+        Outlined text is one surface 2 pixels wider and taller than the plain text,
+        with the text itself placed at (1, 1).
+        """
+        key = (text, font, tuple(color), tuple(outline_color) if outline_color is not None else None)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if outline_color is None:
+            surface = font.render(text, True, color)
+        else:
+            surface = self._render_outlined(text, font, color, outline_color)
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Drop the least recently used surface
+        return surface
+
+    def _render_outlined(self, text, font, color, outline_color):
+        """Composites the outline (drawn in four diagonal directions) and the text into one surface."""
+        base = font.render(text, True, color)
+        outline = font.render(text, True, outline_color)
+        width, height = base.get_size()
+        surface = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+        for dx in [0, 2]:
+            for dy in [0, 2]:
+                surface.blit(outline, (dx, dy))
+        surface.blit(base, (1, 1))
+        return surface
+
+    def clear(self):
+        """Forgets every cached surface."""
+        self.surfaces.clear()
+
+
+# Cache shared by all text drawn in the game
+cache = TextCache()
+
+
+class Hud:
+    """
+    The in-game score, lives and high score labels.
+
+    The labels are looked up again only when one of the values changes;
+    otherwise the surfaces from the last frame are blitted as they are.
+    """
+
+    def __init__(self, font, color, screen_width):
+        self.font = font
+        self.color = color
+        self.screen_width = screen_width
+        self.values = None   # (score, lives, high_score) the labels were made for
+        self.labels = []     # (surface, position) pairs
+
+    def update(self, score, lives, high_score):
+        """Re-renders the labels if any of the values changed."""
+        values = (score, lives, high_score)
+        if values == self.values:
+            return
+        self.values = values
+        self.labels = [
+            (cache.render(f"Score: {score}", self.font, self.color), (10, 10)),
+            (cache.render(f"Lives: {lives}", self.font, self.color), (10, 50)),
+            (cache.render(f"High Score: {high_score}", self.font, self.color), (self.screen_width - 200, 10)),
+        ]
+
+    def draw(self, screen):
+        """Draws the labels. Returns the list of drawn rects."""
+        return screen.blits(self.labels)
@@ -0,0 +1,240 @@
+import random
+
+import numpy as np
+import pygame
+
+import assets
+import logic
+from food import Food
+
+# -------------------------
+# --- VECTORIZED ENVIRONMENTS ---
+# -------------------------
+#
+# Runs N independent SnackLotl games in lockstep with a Gym-style API:
+#
+#   env = VecEnv(64, seed=0)
+#   obs = env.reset()
+#   obs, rewards, dones, info = env.step(actions)   # actions: one input bitmask per game
+#
+# The state of all games lives in NumPy arrays and one step() moves every
+# game at once. The rules are exactly those of logic.Game: with the same seed
+# and the same inputs each game here matches a logic.Game tick for tick.
+# The only per-game Python work is drawing the random numbers for a spawn,
+# which happens once a second of game time.
+#
+# Observations are written into one preallocated array that step() and
+# reset() return every time (the same object, not a copy). Each row holds:
+#   [player_x, score, lives, speed, item x * K, item y * K, item type * K]
+# with type -1 for empty item slots.
+
+OBS_HEADER = 4  # player_x, score, lives, speed
+
+
+class VecEnv:
+    def __init__(self, num_envs, seed=0, width=800, height=600, food_types=logic.FOOD_TYPES,
+                 max_items=8, autoreset=True, assets_path="assets"):
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.food_types = list(food_types)
+        self.toxin = self.food_types.index('toxin') if 'toxin' in self.food_types else -1
+        self.max_items = max_items
+        self.autoreset = autoreset
+        self.assets_path = assets_path
+        self.base_seed = seed
+        self.spawn_interval = max(1, round(logic.SPAWN_INTERVAL_MS * logic.TICK_RATE / 1000))
+        self.player_y = height - logic.PLAYER_OFFSET
+
+        n = num_envs
+        self.rngs = [random.Random() for _ in range(n)]
+        self.seeds = np.zeros(n, dtype=np.int64)
+        self.episodes = np.zeros(n, dtype=np.int64)  # Episodes started per game (for seeding resets)
+        self.player_x = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.speed = np.zeros(n, dtype=np.float64)
+        self.last_speed_step = np.zeros(n, dtype=np.int64)
+        self.tick = np.zeros(n, dtype=np.int64)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.high_score = np.zeros(n, dtype=np.int64)
+        self._allocate_items(max_items)
+
+        self.rewards = np.zeros(n, dtype=np.float32)
+        self.dones = np.zeros(n, dtype=bool)
+        self.final_score = np.zeros(n, dtype=np.int64)  # Score of the episode that just ended
+        self.obs = np.zeros((n, OBS_HEADER + 3 * max_items), dtype=np.float32)
+        self.pixel_surface = None
+        self.pixel_buffer = None
+
+    def _allocate_items(self, capacity):
+        """Creates (or grows) the per-game item arrays to `capacity` slots."""
+        n = self.num_envs
+        old = getattr(self, "item_alive", None)
+        item_x = np.zeros((n, capacity), dtype=np.int64)
+        item_y = np.zeros((n, capacity), dtype=np.float64)
+        item_type = np.zeros((n, capacity), dtype=np.int64)
+        item_alive = np.zeros((n, capacity), dtype=bool)
+        if old is not None:
+            k = old.shape[1]
+            item_x[:, :k] = self.item_x
+            item_y[:, :k] = self.item_y
+            item_type[:, :k] = self.item_type
+            item_alive[:, :k] = old
+        self.item_x, self.item_y, self.item_type, self.item_alive = item_x, item_y, item_type, item_alive
+        self.max_items = capacity
+
+    def reset(self, seeds=None):
+        """
+        Starts a new game in every environment.
+
+        Parameters:
+        - seeds: one seed per game; by default game i of episode e uses
+          seed + i + e * num_envs
+        """
+        if seeds is None:
+            seeds = self.base_seed + np.arange(self.num_envs) + self.episodes * self.num_envs
+        for i in range(self.num_envs):
+            self._reset_one(i, int(seeds[i]))
+        self._write_obs()
+        return self.obs
+
+    def _reset_one(self, i, seed):
+        self.seeds[i] = seed
+        self.episodes[i] += 1
+        self.rngs[i].seed(seed)
+        self.player_x[i] = self.width // 2
+        self.score[i] = 0
+        self.lives[i] = logic.START_LIVES
+        self.speed[i] = logic.START_SPEED
+        self.last_speed_step[i] = 0
+        self.tick[i] = 0
+        self.game_over[i] = False
+        self.item_alive[i] = False
+
+    def _spawn(self, i):
+        """Spawns one item in game i, drawing random numbers in the same order as logic.Game."""
+        rng = self.rngs[i]
+        food_type = rng.choice(self.food_types)
+        x = rng.randint(20, self.width - 20)
+        free = np.flatnonzero(~self.item_alive[i])
+        if len(free) == 0:
+            self._allocate_items(self.max_items * 2)
+            free = np.flatnonzero(~self.item_alive[i])
+            # More item slots make the rows longer, so this is the one time a new obs array is made
+            self.obs = np.zeros((self.num_envs, OBS_HEADER + 3 * self.max_items), dtype=np.float32)
+        slot = free[0]
+        self.item_x[i, slot] = x
+        self.item_y[i, slot] = -50
+        self.item_type[i, slot] = self.food_types.index(food_type)
+        self.item_alive[i, slot] = True
+
+    def step(self, actions):
+        """
+        Advances every game by one tick.
+
+        Parameters:
+        - actions: array of input bitmasks (logic.INPUT_LEFT / logic.INPUT_RIGHT), one per game
+
+        Returns (obs, rewards, dones, info). The reward is +1 for each snack and
+        -1 for each toxin caught. With autoreset, finished games start over
+        right away and info["final_score"] holds the score they ended with.
+        """
+        actions = np.asarray(actions)
+        active = ~self.game_over
+        self.tick[active] += 1
+
+        # Spawn a random food item every second
+        for i in np.flatnonzero(active & (self.tick % self.spawn_interval == 0)):
+            self._spawn(i)
+
+        # Player movement: left first, then right, clamped to the screen each time
+        half = logic.PLAYER_SIZE // 2
+        step = logic.PLAYER_STEP * active
+        left = (actions & logic.INPUT_LEFT) != 0
+        right = (actions & logic.INPUT_RIGHT) != 0
+        self.player_x = np.clip(self.player_x - step * left, half, self.width - half)
+        self.player_x = np.clip(self.player_x + step * right, half, self.width - half)
+
+        # Increase speed gradually every 10 points scored
+        steps = self.score // logic.POINTS_PER_SPEED_STEP
+        speed_up = active & (steps > self.last_speed_step)
+        self.speed += logic.SPEED_STEP * speed_up
+        self.last_speed_step = np.where(speed_up, steps, self.last_speed_step)
+
+        # Items fall at their game's speed
+        moving = self.item_alive & active[:, None]
+        self.item_y += np.where(moving, self.speed[:, None], 0.0)
+
+        # Overlap of every item rect with its game's player rect (same rounding as pygame.Rect)
+        item_left = self.item_x - Food.SIZE // 2
+        item_top = np.trunc(self.item_y + np.copysign(0.5, self.item_y)).astype(np.int64) - Food.SIZE // 2
+        player_left = (self.player_x - half)[:, None]
+        player_top = self.player_y - half
+        hit = moving & ((item_left < player_left + logic.PLAYER_SIZE) & (player_left < item_left + Food.SIZE) &
+                        (item_top < player_top + logic.PLAYER_SIZE) & (player_top < item_top + Food.SIZE))
+        fallen = moving & ~hit & (self.item_y > self.height)
+
+        toxins = (hit & (self.item_type == self.toxin)).sum(axis=1)
+        snacks = hit.sum(axis=1) - toxins
+        self.item_alive &= ~(hit | fallen)
+        self.score += snacks
+        self.lives -= toxins
+        self.rewards[:] = snacks - toxins
+
+        # Game over when the last life is lost
+        self.dones[:] = active & (self.lives <= 0)
+        self.game_over |= self.dones
+        self.high_score = np.maximum(self.high_score, np.where(self.dones, self.score, 0))
+        self.final_score[:] = np.where(self.dones, self.score, 0)
+
+        if self.autoreset and self.dones.any():
+            for i in np.flatnonzero(self.dones):
+                self._reset_one(i, int(self.base_seed + i + self.episodes[i] * self.num_envs))
+
+        self._write_obs()
+        return self.obs, self.rewards, self.dones, {"final_score": self.final_score}
+
+    def _write_obs(self):
+        """Writes the current state of every game into the shared observation array."""
+        k = self.max_items
+        obs = self.obs
+        obs[:, 0] = self.player_x
+        obs[:, 1] = self.score
+        obs[:, 2] = self.lives
+        obs[:, 3] = self.speed
+        empty = ~self.item_alive
+        x, y, types = obs[:, OBS_HEADER:OBS_HEADER + k], obs[:, OBS_HEADER + k:OBS_HEADER + 2 * k], obs[:, OBS_HEADER + 2 * k:]
+        x[...] = self.item_x
+        y[...] = self.item_y
+        types[...] = self.item_type
+        x[empty] = 0
+        y[empty] = 0
+        types[empty] = -1
+
+    def render_pixels(self, size=(84, 84)):
+        """
+        Draws every game to an off-screen surface and returns the pixels.
+
+        Returns a (num_envs, height, width, 3) uint8 array that is reused on
+        each call. Needs the images in assets/ but no window.
+        """
+        if self.pixel_surface is None:
+            self.pixel_surface = pygame.Surface((self.width, self.height))
+            self.pixel_small = pygame.Surface(size)
+            self.pixel_buffer = np.zeros((self.num_envs, size[1], size[0], 3), dtype=np.uint8)
+        surface = self.pixel_surface
+        background = assets.get_image(self.assets_path, "background.jpg", (self.width, self.height))
+        player_image = assets.get_image(self.assets_path, "axolotl_1.png", (logic.PLAYER_SIZE, logic.PLAYER_SIZE))
+        food_images = [assets.get_image(self.assets_path, f"food_{name}.png", (Food.SIZE, Food.SIZE))
+                       for name in self.food_types]
+        for i in range(self.num_envs):
+            surface.blit(background, (0, 0))
+            for slot in np.flatnonzero(self.item_alive[i]):
+                image = food_images[self.item_type[i, slot]]
+                surface.blit(image, image.get_rect(center=(int(self.item_x[i, slot]), float(self.item_y[i, slot]))))
+            surface.blit(player_image, player_image.get_rect(center=(int(self.player_x[i]), self.player_y)))
+            pygame.transform.smoothscale(surface, size, self.pixel_small)
+            # surfarray is indexed [x][y]; the buffer is [y][x]
+            self.pixel_buffer[i] = pygame.surfarray.pixels3d(self.pixel_small).swapaxes(0, 1)
+        return self.pixel_buffer